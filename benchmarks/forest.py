@@ -0,0 +1,90 @@
+# Compares the old MultiOutputRegressor(RandomForestRegressor) setup with
+# the single multi-output forest used by forecaster.train_model: fit time,
+# per-step predict latency, pickled model size and one-step holdout MAE.
+#
+#     python -m benchmarks.forest [--fixtures DIR] [--tickers 1155.KL ...] [--json out.json]
+
+import argparse
+import datetime
+import json
+import pickle
+import tempfile
+import time
+
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.multioutput import MultiOutputRegressor
+
+from yff.forecaster import MODEL_PARAMS, TRAINING_YEARS, train_model, training_data
+from yff.history_store import HistoryStore
+from yff.providers import FakeProvider, FixtureProvider
+
+
+def legacy_model(X, y):
+    model = MultiOutputRegressor(RandomForestRegressor(n_estimators=200, random_state=42))
+    model.fit(X, y)
+    return model
+
+
+def measure(name, fit, X_train, y_train, X_test, y_test, steps=30):
+    start = time.perf_counter()
+    model = fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+
+    row = X_test[-1]
+    latencies = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        row = model.predict(row.reshape(1, -1)).flatten()
+        latencies.append(time.perf_counter() - start)
+
+    mae = float(np.mean(np.abs(model.predict(X_test) - y_test)))
+    return {
+        "model": name,
+        "fit_s": fit_seconds,
+        "predict_ms_p50": float(np.median(latencies)) * 1000,
+        "size_mb": len(pickle.dumps(model)) / 1e6,
+        "mae": mae,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", help="directory of recorded <ticker>.csv bars")
+    parser.add_argument("--tickers", nargs="+", default=["1155.KL", "5347.KL", "0166.KL"])
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    provider = FixtureProvider(args.fixtures) if args.fixtures else FakeProvider()
+    store = HistoryStore(tempfile.mkdtemp(), provider=provider)
+    end = datetime.date.today()
+    start = end - datetime.timedelta(days=TRAINING_YEARS * 365)
+
+    results = []
+    for ticker in args.tickers:
+        X, y, _, _ = training_data(store.fetch(ticker, start, end))
+        if len(X) < 100:
+            print(f"{ticker}: not enough bars, skipped")
+            continue
+        split = int(len(X) * 0.8)
+        data = (X[:split], y[:split], X[split:], y[split:])
+
+        for name, fit in (("multioutput x4", legacy_model),
+                          ("native multi-output", lambda X, y: train_model(X, y, MODEL_PARAMS))):
+            result = measure(name, fit, *data)
+            result["ticker"] = ticker
+            result["rows"] = len(X)
+            results.append(result)
+
+    print(f"{'ticker':<10}{'model':<22}{'fit s':>8}{'step ms':>9}{'size MB':>9}{'MAE':>9}")
+    for r in results:
+        print(f"{r['ticker']:<10}{r['model']:<22}{r['fit_s']:>8.2f}{r['predict_ms_p50']:>9.2f}"
+              f"{r['size_mb']:>9.1f}{r['mae']:>9.4f}")
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
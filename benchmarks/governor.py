@@ -0,0 +1,76 @@
+# Drives quote fetches through FlakyProvider, a local stub that answers 429
+# above `--limit` requests per second (plus random 429s at `--error-rate`),
+# once directly and once through the Governor, then simulates an outage to
+# show the breaker opening, stale values being served and recovery.
+#
+#     python -m benchmarks.governor [--limit 10] [--error-rate 0.05] [--latency 0.02] [--sectors 8]
+
+import argparse
+import sys
+import time
+
+from yff.data import fetch_info_quotes
+from yff.governor import CircuitOpen, Governor
+from yff.providers import FakeProvider, FlakyProvider, GovernedProvider
+from yff.registry import get_registry
+
+
+def burst(provider, sectors):
+    start = time.perf_counter()
+    quoted = total = 0
+    for tickers in sectors:
+        rows, failed = fetch_info_quotes(tickers, provider=provider)
+        quoted += len(tickers) - len(failed)
+        total += len(tickers)
+    return quoted, total, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limit", type=float, default=10, help="stub requests/s before 429")
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--sectors", type=int, default=8)
+    args = parser.parse_args()
+
+    registry = get_registry()
+    market = registry.markets()[0]
+    sectors = [registry.tickers(market, s) for s in registry.sectors(market)[:args.sectors]]
+
+    print(f"{'path':<12}{'quoted':>10}{'429s':>7}{'seconds':>9}")
+    for label, governed in (("direct", False), ("governed", True)):
+        stub = FlakyProvider(FakeProvider(), max_rate=args.limit, error_rate=args.error_rate,
+                             latency=args.latency)
+        provider = GovernedProvider(stub, Governor(rate=args.limit * 0.8, burst=4, seed=0)) if governed else stub
+        quoted, total, seconds = burst(provider, sectors)
+        print(f"{label:<12}{f'{quoted}/{total}':>10}{stub.rejected:>7}{seconds:>9.1f}")
+
+    # Outage: values fetched before the outage keep being served while the
+    # breaker is open; after reset_timeout a probe closes it again.
+    stub = FlakyProvider(FakeProvider(), latency=args.latency)
+    governor = Governor(retries=1, base_delay=0.05, failure_threshold=3, reset_timeout=1, seed=0)
+    provider = GovernedProvider(stub, governor)
+    tickers = sectors[0][:5]
+    provider.quotes(tickers)
+    stub.down = True
+    for _ in range(5):
+        provider.quotes(tickers)
+    try:
+        provider.quotes(sectors[1][:5])
+        unknown = "served"
+    except CircuitOpen:
+        unknown = "CircuitOpen"
+    during = governor.stats()
+    stub.down = False
+    time.sleep(1.1)
+    provider.quotes(tickers)
+    after = governor.stats()
+
+    print(f"outage: breaker {during['breakers']['quotes']}, {during['stale']} stale answers, "
+          f"{during['rejected']} calls rejected without reaching the stub, uncached key -> {unknown}")
+    print(f"recovered: breaker {after['breakers']['quotes']}")
+    return 0 if during["breakers"]["quotes"] == "open" and after["breakers"]["quotes"] == "closed" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
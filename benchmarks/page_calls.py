@@ -0,0 +1,73 @@
+# Counts upstream provider requests per cold page render (quote and name
+# caches cleared) with the fake provider. A ticker may appear in one batched
+# quote request and one name lookup per render, never more; the run exits
+# non-zero if any page asks an endpoint for the same ticker twice, including
+# the compare page's combined fetch of two sectors. The view page's table is
+# a fragment, which does not run outside `streamlit run`, so its row goes
+# through what the fragment asks for: a QuotePoller subscription and the
+# first snapshot. Background name lookups are waited for before counting.
+#
+#     python -m benchmarks.page_calls
+
+import sys
+
+from yff.compare import compare_sector, load_comparison
+from yff.data import REQUEST_TIMEOUT, get_quotes, name_cache, quote_cache, wait_for_names
+from yff.poller import QuotePoller
+from yff.providers import FakeProvider, set_provider
+from yff.registry import get_registry
+
+
+def show_sector(market, refresh_rate, sector):
+    # view.show_sector's fetch path, on a poller of its own so every row
+    # starts cold.
+    poller = QuotePoller(get_quotes)
+    universe = poller.subscribe("page_calls", get_registry().tickers(market, sector), refresh_rate)
+    _, snapshot, _ = poller.snapshot(universe, timeout=REQUEST_TIMEOUT * 2)
+    poller.unsubscribe("page_calls")
+    if snapshot is None:
+        raise RuntimeError(f"no snapshot for {market} / {sector}")
+
+
+def render(provider, page, *args):
+    quote_cache.clear()
+    name_cache.clear()
+    provider.reset()
+    page(*args)
+    wait_for_names()
+    tickers = {ticker for _, ticker in provider.requested}
+    duplicates = sum(count - 1 for count in provider.requested.values())
+    return provider.calls, len(tickers), duplicates
+
+
+def main():
+    provider = FakeProvider()
+    set_provider(provider)
+
+    failures = 0
+    registry = get_registry()
+    print(f"{'page':<16}{'market':<14}{'sector':<48}{'calls':>7}{'tickers':>9}")
+    for market in registry.markets():
+        for sector in registry.sectors(market):
+            for page, args in ((show_sector, (market, 60, sector)),
+                               (compare_sector, (market, 80.0, sector))):
+                calls, tickers, duplicates = render(provider, page, *args)
+                flag = "  <-- duplicate fetches" if duplicates else ""
+                failures += bool(duplicates)
+                print(f"{page.__name__:<16}{market:<14}{sector:<48}{calls:>7}{tickers:>9}{flag}")
+
+    # The compare page fetches both selections in one batch, so a ticker
+    # listed in both sectors of a pair is still requested only once.
+    selections = [(market, sector) for market in registry.markets() for sector in registry.sectors(market)]
+    for pair in zip(selections, selections[1:] + selections[:1]):
+        calls, tickers, duplicates = render(provider, load_comparison, list(pair))
+        flag = "  <-- duplicate fetches" if duplicates else ""
+        failures += bool(duplicates)
+        label = " vs ".join(sector for _, sector in pair)
+        print(f"{'load_comparison':<16}{pair[0][0]:<14}{label[:47]:<48}{calls:>7}{tickers:>9}{flag}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
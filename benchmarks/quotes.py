@@ -0,0 +1,82 @@
+# Bytes and latency per sector for the two quote paths, served by
+# FixtureProvider from recorded responses: the old one full .info payload
+# per ticker, and the batched latest-bar quotes with names from the name
+# cache (cold: every name looked up, warm: names already cached). Cold names
+# load in the background: ms is until the prices are back, requests and KB
+# include the name lookups.
+# Without --fixtures a synthetic set is recorded from FakeProvider first.
+#
+#     python -m benchmarks.quotes [--fixtures DIR] [--latency 0.05] [--markets "ACE Market"] [--json out.json]
+
+import argparse
+import datetime
+import json
+import tempfile
+import time
+
+from yff.data import fetch_info_quotes, fetch_quotes, name_cache, wait_for_names
+from yff.providers import FakeProvider, FixtureProvider, record_fixtures
+from yff.registry import get_registry
+
+
+def measure(provider, fetch, tickers):
+    calls, size = provider.calls, provider.bytes
+    start = time.perf_counter()
+    rows, failed = fetch(tickers, provider=provider)
+    ms = (time.perf_counter() - start) * 1000
+    wait_for_names()
+    return {
+        "requests": provider.calls - calls,
+        "kb": (provider.bytes - size) / 1024,
+        "ms": ms,
+        "failed": len(failed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", help="directory recorded with providers.record_fixtures")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request")
+    parser.add_argument("--markets", nargs="+", help="limit to these markets")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    registry = get_registry()
+    markets = args.markets or registry.markets()
+    directory = args.fixtures
+    if directory is None:
+        end = datetime.date.today()
+        directory = record_fixtures(FakeProvider(), tempfile.mkdtemp(), registry.all_tickers(markets),
+                                    end - datetime.timedelta(days=10), end)
+    provider = FixtureProvider(directory, latency=args.latency)
+
+    results = []
+    for market in markets:
+        for sector in registry.sectors(market):
+            tickers = registry.tickers(market, sector)
+            name_cache.clear()
+            result = {"market": market, "sector": sector, "tickers": len(tickers)}
+            result["info"] = measure(provider, fetch_info_quotes, tickers)
+            result["batched_cold"] = measure(provider, fetch_quotes, tickers)
+            result["batched_warm"] = measure(provider, fetch_quotes, tickers)
+            results.append(result)
+
+    paths = ("info", "batched_cold", "batched_warm")
+    print(f"{'market':<14}{'sector':<40}{'n':>4}" + "".join(f"{p + ' req/KB/ms':>26}" for p in paths))
+    for r in results:
+        cells = "".join(f"{r[p]['requests']:>8}{r[p]['kb']:>9.1f}{r[p]['ms']:>9.0f}" for p in paths)
+        print(f"{r['market']:<14}{r['sector'][:39]:<40}{r['tickers']:>4}{cells}")
+    totals = "".join(
+        f"{sum(r[p]['requests'] for r in results):>8}{sum(r[p]['kb'] for r in results):>9.0f}"
+        f"{sum(r[p]['ms'] for r in results):>9.0f}"
+        for p in paths
+    )
+    print(f"{'total':<54}{sum(r['tickers'] for r in results):>4}{totals}")
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
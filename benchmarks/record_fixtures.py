@@ -0,0 +1,58 @@
+# Writes a fixture set served by FixtureProvider: a gzipped quotes.json of
+# full .info payloads and <ticker>.csv.gz daily bars for every ticker of the
+# chosen sector, plus meta.json describing how it was made. --source yahoo
+# records real responses (needs network); --source fake regenerates byte for
+# byte, and is what benchmarks/suite.py writes to a temporary directory when
+# it is not given --fixtures.
+#
+#     python -m benchmarks.record_fixtures --out DIR [--source fake|yahoo] [--market "Main Market"]
+#                                          [--sector Property] [--years 2] [--end 2026-10-16]
+
+import argparse
+import datetime
+import json
+import os
+
+from yff.providers import FakeProvider, YahooProvider, record_fixtures
+from yff.registry import get_registry
+
+
+END = datetime.date(2026, 10, 16)
+
+
+def write_fixtures(directory, source="fake", market="Main Market", sector="Property", years=2, end=END):
+    # Records the set into `directory` and returns its meta.json contents.
+    tickers = get_registry().tickers(market, sector)
+    start = end - datetime.timedelta(days=years * 365)
+    provider = FakeProvider() if source == "fake" else YahooProvider()
+    record_fixtures(provider, directory, tickers, start, end, compress=True, float_format="%.4f")
+
+    meta = {
+        "source": source,
+        "market": market,
+        "sector": sector,
+        "tickers": list(tickers),
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+    }
+    with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as fh:
+        json.dump(meta, fh, indent=2)
+    return meta
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", required=True, help="directory to write")
+    parser.add_argument("--source", choices=("fake", "yahoo"), default="fake")
+    parser.add_argument("--market", default="Main Market")
+    parser.add_argument("--sector", default="Property")
+    parser.add_argument("--years", type=int, default=2)
+    parser.add_argument("--end", type=datetime.date.fromisoformat, default=END)
+    args = parser.parse_args()
+
+    meta = write_fixtures(args.out, args.source, args.market, args.sector, args.years, args.end)
+    print(f"wrote {len(meta['tickers'])} tickers ({meta['start']} to {meta['end']}) to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Per-step latency of the 30-day recursive forecast: sklearn predict() on a
+# single row versus the compiled forest in fast_forest.py. Also checks that
+# both produce the same forecast path.
+#
+#     python -m benchmarks.recursive [--fixtures DIR] [--ticker 1155.KL] [--steps 30]
+
+import argparse
+import datetime
+import tempfile
+import time
+
+import numpy as np
+
+from yff.fast_forest import CompiledForest
+from yff.features import from_windows
+from yff.forecaster import FEATURE_SPEC, MODEL_PARAMS, TRAINING_YEARS, train_model, training_data
+from yff.history_store import HistoryStore
+from yff.providers import FakeProvider, FixtureProvider
+
+
+def run_path(predict, window, steps):
+    window = np.array(window, dtype=float)
+    path, latencies = [], []
+    for _ in range(steps):
+        start = time.perf_counter()
+        next_day = predict(from_windows(window[None], FEATURE_SPEC)).flatten()
+        latencies.append(time.perf_counter() - start)
+        path.append(next_day)
+        window = np.vstack([window[1:], next_day])
+    return np.array(path), np.array(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", help="directory of recorded <ticker>.csv bars")
+    parser.add_argument("--ticker", default="1155.KL")
+    parser.add_argument("--steps", type=int, default=30)
+    args = parser.parse_args()
+
+    provider = FixtureProvider(args.fixtures) if args.fixtures else FakeProvider()
+    end = datetime.date.today()
+    start = end - datetime.timedelta(days=TRAINING_YEARS * 365)
+    data = HistoryStore(tempfile.mkdtemp(), provider=provider).fetch(args.ticker, start, end)
+    X, y, window, _ = training_data(data)
+    model = train_model(X, y, MODEL_PARAMS)
+
+    start = time.perf_counter()
+    compiled = CompiledForest.from_sklearn(model)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    sk_path, sk_lat = run_path(model.predict, window, args.steps)
+    fast_path, fast_lat = run_path(compiled.predict, window, args.steps)
+
+    print(f"{args.ticker}: {len(X)} rows, {compiled.n_trees} trees, depth {compiled.depth}, "
+          f"compiled in {compile_ms:.1f} ms")
+    print(f"{'predictor':<12}{'p50 ms':>9}{'p95 ms':>9}{'total ms':>10}")
+    for name, lat in (("sklearn", sk_lat), ("compiled", fast_lat)):
+        print(f"{name:<12}{np.median(lat) * 1000:>9.3f}{np.percentile(lat, 95) * 1000:>9.3f}{lat.sum() * 1000:>10.2f}")
+    print(f"speedup x{np.median(sk_lat) / np.median(fast_lat):.1f}, "
+          f"max abs path difference {np.abs(sk_path - fast_path).max():.2e}")
+
+    if not np.allclose(sk_path, fast_path, rtol=1e-9, atol=1e-12):
+        raise SystemExit("compiled forest diverged from sklearn predictions")
+
+
+if __name__ == "__main__":
+    main()
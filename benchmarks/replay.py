@@ -0,0 +1,121 @@
+# Reproduces a refresh storm offline. `record` runs what the dashboard asks
+# the provider for (get_stock_data for every sector of a market, a few
+# times, plus the forecast history download for one sector) through a
+# RecordingProvider into an archive. `storm` replays it: N sessions refresh
+# the whole market at once against a ReplayProvider behind the Governor,
+# with and without the quote cache (names already cached), and report wall
+# time, per-session latency and how many calls reached the upstream.
+#
+#     python -m benchmarks.replay record --out storm.bin [--source fake|yahoo] [--market "Main Market"]
+#                                        [--refreshes 3] [--sector Property]
+#     python -m benchmarks.replay storm --archive storm.bin [--sessions 1 10 50] [--scale 1.0] [--paced]
+#                                       [--json out.json]
+
+import argparse
+import datetime
+import json
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from yff.data import get_stock_data, name_cache, quote_cache, wait_for_names
+from yff.forecaster import TRAINING_YEARS
+from yff.governor import Governor
+from yff.history_store import HistoryStore
+from yff.providers import FakeProvider, GovernedProvider, RecordingProvider, ReplayProvider, YahooProvider
+from yff.registry import get_registry
+
+
+def record(args):
+    # Yahoo is recorded behind the Governor, as the dashboard calls it; the
+    # fake source needs no pacing.
+    if args.source == "fake":
+        recorder = provider = RecordingProvider(FakeProvider(latency=0.05), args.out)
+    else:
+        recorder = RecordingProvider(YahooProvider(), args.out)
+        provider = GovernedProvider(recorder)
+    registry = get_registry()
+    tickers = registry.all_tickers([args.market])
+    for _ in range(args.refreshes):
+        get_stock_data(tickers, provider=provider, use_cache=False)
+        wait_for_names()
+
+    end = datetime.date.today()
+    start = end - datetime.timedelta(days=TRAINING_YEARS * 365)
+    HistoryStore(tempfile.mkdtemp(), provider=provider).fetch_many(
+        registry.tickers(args.market, args.sector), start, end)
+    print(f"recorded {recorder.calls} calls for {len(tickers)} tickers to {args.out}")
+
+
+def storm(args):
+    tickers = get_registry().all_tickers([args.market])
+    # Names are cached for a day in the dashboard, so they are loaded once
+    # up front and only the quotes are refreshed by the storm.
+    name_cache.clear()
+    get_stock_data(tickers, provider=ReplayProvider(args.archive, scale=0), use_cache=False)
+    wait_for_names()
+
+    results = []
+    for sessions in args.sessions:
+        for use_cache in (False, True):
+            replay = ReplayProvider(args.archive, scale=args.scale, paced=args.paced)
+            provider = GovernedProvider(replay, Governor())
+            quote_cache.clear()
+
+            def session(_):
+                start = time.perf_counter()
+                get_stock_data(tickers, provider=provider, use_cache=use_cache)
+                return time.perf_counter() - start
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=sessions) as pool:
+                latencies = list(pool.map(session, range(sessions)))
+            results.append({
+                "sessions": sessions,
+                "cache": use_cache,
+                "wall_s": time.perf_counter() - start,
+                "p50_s": float(np.median(latencies)),
+                "p95_s": float(np.percentile(latencies, 95)),
+                "upstream_calls": replay.calls,
+                "misses": replay.misses,
+            })
+
+    print(f"{'sessions':>8}{'cache':>7}{'wall s':>9}{'p50 s':>9}{'p95 s':>9}{'upstream':>10}{'misses':>8}")
+    for r in results:
+        print(f"{r['sessions']:>8}{'on' if r['cache'] else 'off':>7}{r['wall_s']:>9.2f}{r['p50_s']:>9.2f}"
+              f"{r['p95_s']:>9.2f}{r['upstream_calls']:>10}{r['misses']:>8}")
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    recording = commands.add_parser("record", help="record a session into an archive")
+    recording.add_argument("--out", required=True, help="archive to write")
+    recording.add_argument("--source", choices=("fake", "yahoo"), default="fake")
+    recording.add_argument("--market", default="Main Market")
+    recording.add_argument("--sector", default="Property", help="sector whose history forecast() downloads")
+    recording.add_argument("--refreshes", type=int, default=3, help="whole-market quote refreshes to record")
+    recording.set_defaults(run=record)
+
+    storming = commands.add_parser("storm", help="replay an archive as N simultaneous refreshes")
+    storming.add_argument("--archive", required=True)
+    storming.add_argument("--market", default="Main Market")
+    storming.add_argument("--sessions", nargs="+", type=int, default=(1, 10, 50))
+    storming.add_argument("--scale", type=float, default=1.0, help="multiplier on the recorded timing")
+    storming.add_argument("--paced", action="store_true", help="hold calls to the recorded schedule")
+    storming.add_argument("--json", help="write results to this file")
+    storming.set_defaults(run=storm)
+
+    args = parser.parse_args()
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+# Drives N simulated desk sessions through yfs.py at once with Streamlit's
+# AppTest, against a local provider, and reports how the process holds up
+# as N grows: CPU, peak resident memory, peak thread count, upstream calls,
+# render latency and errors. Each session opens the app, goes to its page,
+# picks a sector (spread over the market so sessions do not all share one)
+# and then reruns `--rounds` times, which stands in for its refresh ticks.
+# Script runs are serialised (see Session), so this measures the shared
+# fetch and cache layers under N users, not N scripts rendering in parallel.
+#
+#     python -m benchmarks.sessions [--sessions 1 5 10 25] [--rounds 3] [--pause 1.0]
+#                                   [--flow view|compare|screener|mixed] [--provider fake|replay:<archive>]
+#                                   [--scale 0] [--json out.json]
+#
+# --provider takes the YFF_PROVIDER syntax; a replay archive comes from
+# `python -m benchmarks.replay record`.
+
+import argparse
+import json
+import os
+import resource
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+from yff.data import name_cache, quote_cache, quote_poller, wait_for_names
+from yff.providers import provider_from_env, set_provider
+from yff.registry import get_registry
+
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "yfs.py")
+FLOWS = {
+    "view": "View Present Stock Data",
+    "compare": "Compare Stock Data",
+    "screener": "Screener",
+}
+MARKET = "Main Market"
+
+
+def rss_mb():
+    # Current resident set size; peak RSS where /proc is not available.
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Sampler:
+    # Samples thread count and memory every `interval` seconds until stopped.
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.threads = 0
+        self.rss = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.threads = max(self.threads, threading.active_count())
+            self.rss = max(self.rss, rss_mb())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def open_steps(at, flow, index):
+    # The interactions that take a fresh session to its page and make its
+    # first choices, each ending in a rerun.
+    steps = [lambda: at.sidebar.selectbox[0].set_value(FLOWS[flow]).run()]
+    if flow == "view":
+        sectors = get_registry().sectors(MARKET)
+        sector = sectors[index % len(sectors)]
+        steps.append(lambda: at.selectbox(key="market_display").set_value(MARKET).run())
+        steps.append(lambda: at.selectbox(key=f"sector_display_{MARKET}").set_value(sector).run())
+    elif flow == "compare":
+        steps.append(lambda: at.button[0].click().run())
+    return steps
+
+
+class Session:
+    # One simulated user. AppTest creates and tears down Streamlit's global
+    # Runtime around every run, so two runs at once break each other; RUN_LOCK
+    # lets one session render at a time. Sessions still overlap in everything
+    # else (pauses, the poller, background name loads, the provider), but
+    # renders are serialised: `render` times the run itself, `queued` the wait
+    # for the lock.
+    RUN_LOCK = threading.Lock()
+
+    def __init__(self, flow, index):
+        self.flow = flow
+        self.index = index
+        self.at = AppTest.from_file(APP, default_timeout=120)
+        self.renders = []
+        self.queued = []
+        self.errors = []
+
+    def run(self, step):
+        waiting = time.perf_counter()
+        with self.RUN_LOCK:
+            start = time.perf_counter()
+            step()
+            elapsed = time.perf_counter() - start
+        self.queued.append(start - waiting)
+        self.errors.extend(str(exc.value) for exc in self.at.exception)
+        return elapsed
+
+    def drive(self, rounds, pause):
+        # Returns (seconds to open the app and reach the page, seconds per
+        # rerun). Anything raised is recorded as an error of the session.
+        opened, reruns = 0.0, []
+        try:
+            opened += self.run(self.at.run)
+            for step in open_steps(self.at, self.flow, self.index):
+                opened += self.run(step)
+            for _ in range(rounds):
+                time.sleep(pause)
+                reruns.append(self.run(self.at.run))
+        except Exception as exc:
+            self.errors.append(repr(exc))
+        return opened, reruns
+
+    def session_id(self):
+        state = self.at.session_state
+        return state["session_id"] if "session_id" in state else None
+
+
+def run_level(args, sessions):
+    provider = provider_from_env()
+    set_provider(provider)
+    upstream = getattr(provider, "inner", provider)
+    quote_cache.clear()
+    name_cache.clear()
+    fetches = quote_poller.fetches
+    flows = list(FLOWS) if args.flow == "mixed" else [args.flow]
+
+    cpu = os.times()
+    start = time.perf_counter()
+    users = [Session(flows[index % len(flows)], index) for index in range(sessions)]
+    with Sampler() as sampler, ThreadPoolExecutor(max_workers=sessions) as pool:
+        results = list(pool.map(lambda user: user.drive(args.rounds, args.pause), users))
+    wall = time.perf_counter() - start
+    cpu_end = os.times()
+    # Names still loading in the background belong to this level's calls.
+    wait_for_names()
+
+    for user in users:
+        try:
+            session_id = user.session_id()
+        except Exception:
+            session_id = None
+        if session_id is not None:
+            quote_poller.unsubscribe(session_id)
+
+    opened = [seconds for seconds, _ in results]
+    renders = [seconds for _, reruns in results for seconds in reruns] or opened
+    queued = [seconds for user in users for seconds in user.queued]
+    return {
+        "sessions": sessions,
+        "wall_s": wall,
+        "cpu_pct": (cpu_end.user + cpu_end.system - cpu.user - cpu.system) / wall * 100,
+        "peak_rss_mb": sampler.rss,
+        "peak_threads": sampler.threads,
+        "upstream_calls": getattr(upstream, "calls", None),
+        "poller_fetches": quote_poller.fetches - fetches,
+        "open_p50_s": float(np.median(opened)),
+        "render_p50_s": float(np.median(renders)),
+        "render_p95_s": float(np.percentile(renders, 95)),
+        "queued_p50_s": float(np.median(queued)),
+        "errors": sum(len(user.errors) for user in users),
+        "errors_seen": sorted({error for user in users for error in user.errors}),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", nargs="+", type=int, default=(1, 5, 10, 25))
+    parser.add_argument("--rounds", type=int, default=3, help="reruns per session after opening its page")
+    parser.add_argument("--pause", type=float, default=1.0, help="seconds between a session's reruns")
+    parser.add_argument("--flow", choices=tuple(FLOWS) + ("mixed",), default="view")
+    parser.add_argument("--provider", default="fake", help="YFF_PROVIDER value, e.g. replay:storm.bin")
+    parser.add_argument("--scale", type=float, default=0.0, help="YFF_REPLAY_SCALE for a replay provider")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    os.environ["YFF_PROVIDER"] = args.provider
+    os.environ["YFF_REPLAY_SCALE"] = str(args.scale)
+
+    results = [run_level(args, sessions) for sessions in args.sessions]
+
+    print(f"{'sessions':>8}{'wall s':>8}{'cpu %':>7}{'rss MB':>8}{'threads':>8}{'upstream':>9}{'polls':>6}"
+          f"{'open p50':>9}{'p50 s':>7}{'p95 s':>7}{'queued':>7}{'errors':>7}")
+    for r in results:
+        print(f"{r['sessions']:>8}{r['wall_s']:>8.1f}{r['cpu_pct']:>7.0f}{r['peak_rss_mb']:>8.0f}"
+              f"{r['peak_threads']:>8}{r['upstream_calls'] if r['upstream_calls'] is not None else '-':>9}"
+              f"{r['poller_fetches']:>6}{r['open_p50_s']:>9.2f}{r['render_p50_s']:>7.2f}"
+              f"{r['render_p95_s']:>7.2f}{r['queued_p50_s']:>7.2f}{r['errors']:>7}")
+    for r in results:
+        for error in r["errors_seen"]:
+            print(f"{r['sessions']} sessions: {error}")
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
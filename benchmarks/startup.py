@@ -0,0 +1,79 @@
+# Import cost per page of yfs.py, measured with `python -X importtime` in a
+# fresh interpreter for each page. "page ms" is what the page adds on top of
+# the shell every page pays for (streamlit + the yff package), and the packages
+# listed are the ones whose modules account for most of that difference.
+#
+#     python -m benchmarks.startup [--repeat 3] [--top 8] [--json out.json]
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import yff
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SHELL = ["streamlit", "yff"]
+PAGES = {name: [module] for name, module in yff.PAGES.items()}
+
+
+def import_times(modules):
+    # {top-level package: microseconds} for one cold interpreter, summing the
+    # self time of every module under that package.
+    code = "; ".join(f"import {name}" for name in modules) or "pass"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, _, name = line[len("import time:"):].split("|")
+        if not own.strip().isdigit():
+            continue
+        package = name.strip().split(".")[0]
+        times[package] = times.get(package, 0) + int(own)
+    return times
+
+
+def best_of(modules, repeat):
+    runs = [import_times(modules) for _ in range(repeat)]
+    return min(runs, key=lambda times: sum(times.values()))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    shell = best_of(SHELL, args.repeat)
+    shell_ms = sum(shell.values()) / 1000
+
+    results = {}
+    print(f"{'page':<26}{'total ms':>10}{'page ms':>10}  heaviest imports beyond the shell")
+    for page, modules in PAGES.items():
+        times = best_of(SHELL + modules, args.repeat)
+        total_ms = sum(times.values()) / 1000
+        extra = sorted(((t - shell.get(n, 0), n) for n, t in times.items()), reverse=True)[:args.top]
+        extra = [(t, n) for t, n in extra if t > 0]
+        results[page] = {
+            "total_ms": total_ms,
+            "page_ms": max(total_ms - shell_ms, 0.0),
+            "heaviest": {name: t / 1000 for t, name in extra},
+        }
+        heaviest = ", ".join(f"{name} {t / 1000:.0f}" for t, name in extra)
+        print(f"{page:<26}{total_ms:>10.0f}{results[page]['page_ms']:>10.0f}  {heaviest}")
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump({"shell_ms": shell_ms, "pages": results}, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# Regression suite over a fixture set at growing ticker counts:
+# get_stock_data cold and warm, filter_by_price, and forecast_many.
+# Everything is served by FixtureProvider with a fixed per-request latency,
+# so two runs on the same machine are comparable; --json keeps a run and
+# --baseline prints the change against an earlier one. Without --fixtures
+# the synthetic set (record_fixtures.py --source fake, which regenerates byte
+# for byte) is written to a temporary directory first; pass a --source yahoo
+# recording to run on real data.
+#
+#     python -m benchmarks.suite [--fixtures DIR] [--sizes 1 5 10 25 50 98] [--latency 0.05] [--repeat 3]
+#                                [--model "Random forest"] [--skip forecast] [--json out.json]
+#                                [--baseline previous.json]
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from yff.compare import filter_by_price
+from yff.data import get_stock_data, name_cache, quote_cache, wait_for_names
+from yff.forecaster import forecast_many
+from yff.history_store import HistoryStore
+from yff.models import DEFAULT_MODEL, MODELS
+from yff.providers import FixtureProvider
+
+from .record_fixtures import write_fixtures
+
+
+SIZES = (1, 5, 10, 25, 50, 98)
+BENCHMARKS = ("stock_data", "filter", "forecast")
+
+
+def stock_data(provider, tickers, repeat):
+    # Cold: both caches empty, every quote batch and name is requested (the
+    # latency is until the prices are back, the requests and KB include the
+    # names loaded in the background). Warm: the same call again straight
+    # after, answered from the caches.
+    result = {}
+    for phase in ("cold", "warm"):
+        timings, calls, size = [], 0, 0
+        for _ in range(repeat):
+            if phase == "cold":
+                quote_cache.clear()
+                name_cache.clear()
+            else:
+                get_stock_data(tickers, provider=provider)
+            before_calls, before_bytes = provider.calls, provider.bytes
+            start = time.perf_counter()
+            get_stock_data(tickers, provider=provider)
+            timings.append(time.perf_counter() - start)
+            wait_for_names()
+            calls, size = provider.calls - before_calls, provider.bytes - before_bytes
+        seconds = float(np.median(timings))
+        result[f"{phase}_ms"] = seconds * 1000
+        result[f"{phase}_tickers_per_s"] = len(tickers) / seconds
+        result[f"{phase}_requests"] = calls
+        result[f"{phase}_kb"] = size / 1024
+    return result
+
+
+def price_filter(provider, tickers, repeat, thresholds=50):
+    df = get_stock_data(tickers, provider=provider)
+    prices = df["Open"].dropna()
+    levels = np.linspace(prices.min(), prices.max(), thresholds) if len(prices) else [0.0]
+    timings = []
+    for _ in range(repeat):
+        for level in levels:
+            start = time.perf_counter()
+            filter_by_price(df, level)
+            timings.append(time.perf_counter() - start)
+    return {"p50_ms": float(np.median(timings)) * 1000, "p95_ms": float(np.percentile(timings, 95)) * 1000}
+
+
+def forecast(histories, repeat, model):
+    timings, failed = [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        failed = sum(error is not None for _, _, error in forecast_many(histories, model=model))
+        timings.append(time.perf_counter() - start)
+    seconds = float(np.median(timings))
+    return {"wall_s": seconds, "tickers_per_s": len(histories) / seconds, "failed": failed}
+
+
+def run_meta(args, fixtures):
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "commit": commit or None,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "latency": args.latency,
+        "repeat": args.repeat,
+        "model": args.model,
+        "fixtures": {key: fixtures[key] for key in ("source", "start", "end")},
+        "run_at": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def print_results(results, baseline=None):
+    print(f"{'benchmark':<12}{'n':>4}  {'metric':<22}{'value':>12}{'baseline':>12}{'change':>9}")
+    for name, sizes in results.items():
+        for size, metrics in sizes.items():
+            before = (baseline or {}).get(name, {}).get(size, {})
+            for metric, value in metrics.items():
+                line = f"{name:<12}{size:>4}  {metric:<22}{value:>12.2f}"
+                if metric in before:
+                    change = (value - before[metric]) / before[metric] * 100 if before[metric] else 0.0
+                    line += f"{before[metric]:>12.2f}{change:>+8.1f}%"
+                print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", help="directory written by record_fixtures")
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES, help="ticker counts to run")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, the median is kept")
+    parser.add_argument("--model", choices=tuple(MODELS), default=DEFAULT_MODEL)
+    parser.add_argument("--skip", nargs="+", choices=BENCHMARKS, default=(), help="benchmarks to leave out")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="earlier --json output to compare against")
+    args = parser.parse_args()
+
+    if args.fixtures is None:
+        args.fixtures = tempfile.mkdtemp()
+        fixtures = write_fixtures(args.fixtures)
+    else:
+        with open(os.path.join(args.fixtures, "meta.json"), encoding="utf-8") as fh:
+            fixtures = json.load(fh)
+    provider = FixtureProvider(args.fixtures, latency=args.latency)
+    store = HistoryStore(tempfile.mkdtemp(), provider=FixtureProvider(args.fixtures))
+    start = datetime.date.fromisoformat(fixtures["start"])
+    end = datetime.date.fromisoformat(fixtures["end"]) + datetime.timedelta(days=1)
+
+    results = {name: {} for name in BENCHMARKS if name not in args.skip}
+    for size in args.sizes:
+        tickers = fixtures["tickers"][:size]
+        key = str(len(tickers))
+        if "stock_data" in results:
+            results["stock_data"][key] = stock_data(provider, tickers, args.repeat)
+        if "filter" in results:
+            results["filter"][key] = price_filter(provider, tickers, args.repeat)
+        if "forecast" in results:
+            histories = store.fetch_many(tickers, start, end)
+            results["forecast"][key] = forecast(histories, args.repeat, args.model)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)["results"]
+    print_results(results, baseline)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump({"meta": run_meta(args, fixtures), "results": results}, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
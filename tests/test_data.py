@@ -0,0 +1,58 @@
+import threading
+import time
+
+from yff import data
+from yff import quote_cache as quote_cache_module
+from yff.data import fetch_each, get_stock_data, name_cache, quote_cache, wait_for_names, warm_names
+from yff.providers import FakeProvider
+
+
+def test_fetch_each_keeps_order_and_reports_failures():
+    def fetch(item):
+        if item == "bad":
+            raise ValueError(item)
+        return item.upper()
+
+    results, failed = fetch_each(["a", "bad", "c"], fetch, max_workers=2, timeout=5)
+    assert results == ["A", None, "C"]
+    assert [item for item, _ in failed] == ["bad"]
+
+
+def test_fetch_each_deadline_covers_queued_items():
+    release = threading.Event()
+
+    def fetch(item):
+        if item.startswith("hung"):
+            release.wait(30)
+        return item
+
+    start = time.monotonic()
+    try:
+        results, failed = fetch_each(["hung1", "hung2", "a", "b"], fetch, max_workers=2, timeout=0.5)
+    finally:
+        release.set()
+    assert time.monotonic() - start < 2
+    assert results == [None, None, None, None]
+    assert sorted(item for item, _ in failed) == ["a", "b", "hung1", "hung2"]
+
+
+def test_one_shot_callers_wait_for_names():
+    name_cache.clear()
+    quote_cache.clear()
+    provider = FakeProvider(latency=0.05, fail=["FAIL.KL"])
+    df = get_stock_data(["1155.KL", "1023.KL", "FAIL.KL"], provider=provider, names_timeout=5)
+    names = dict(zip(df["Ticker"], df["Name"]))
+    assert names == {"1155.KL": "FAKE 1155", "1023.KL": "FAKE 1023", "FAIL.KL": ""}
+
+
+def test_failed_names_expire_early(monkeypatch):
+    name_cache.clear()
+    provider = FakeProvider(fail=["FAIL.KL"])
+    warm_names(["1155.KL", "FAIL.KL"], provider)
+    assert wait_for_names(["1155.KL", "FAIL.KL"], timeout=5)
+    assert name_cache.peek_many(["1155.KL", "FAIL.KL"]) == {"1155.KL": "FAKE 1155", "FAIL.KL": ""}
+
+    now = time.monotonic()
+    monkeypatch.setattr(quote_cache_module.time, "monotonic", lambda: now + data.NAME_RETRY + 1)
+    assert name_cache.peek_many(["1155.KL", "FAIL.KL"]) == {"1155.KL": "FAKE 1155"}
+    assert name_cache.stats()["misses"] == 1
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from yff import features
+from yff.features import DEFAULT_SPEC, FeatureCache, build_features
+
+
+def bars(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 10 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    ohlc = np.column_stack([close * 1.001, close * 1.01, close * 0.99, close])
+    return pd.bdate_range("2020-01-01", periods=n).values, ohlc
+
+
+def counting(monkeypatch):
+    built = []
+    original = features.build_features
+
+    def build(ohlc, spec=DEFAULT_SPEC):
+        built.append(len(ohlc))
+        return original(ohlc, spec)
+    monkeypatch.setattr(features, "build_features", build)
+    return built
+
+
+def test_sliding_window_only_builds_new_rows(monkeypatch):
+    dates, ohlc = bars(1400)
+    cache = FeatureCache()
+    cache.get("T", dates[:1300], ohlc[:1300])
+    built = counting(monkeypatch)
+    for day in range(1, 4):
+        window = slice(day, 1300 + day)
+        matrix = cache.get("T", dates[window], ohlc[window])
+        np.testing.assert_array_equal(matrix, build_features(ohlc[window]))
+    assert max(built) < DEFAULT_SPEC.window + 1
+
+
+def test_appended_and_dropped_bars(monkeypatch):
+    dates, ohlc = bars(500, seed=1)
+    cache = FeatureCache()
+    cache.get("T", dates[:400], ohlc[:400])
+    np.testing.assert_array_equal(cache.get("T", dates[:450], ohlc[:450]), build_features(ohlc[:450]))
+    np.testing.assert_array_equal(cache.get("T", dates[30:450], ohlc[30:450]), build_features(ohlc[30:450]))
+
+
+def test_unrelated_history_is_rebuilt():
+    dates, ohlc = bars(300, seed=2)
+    cache = FeatureCache()
+    cache.get("T", dates[:200], ohlc[:200])
+    np.testing.assert_array_equal(cache.get("T", dates[-50:], ohlc[-50:]), build_features(ohlc[-50:]))
+    np.testing.assert_array_equal(cache.get("T", dates[:10], ohlc[:10]), build_features(ohlc[:10]))
+
+
+def test_rebased_history_is_rebuilt():
+    dates, ohlc = bars(300, seed=3)
+    cache = FeatureCache()
+    cache.get("T", dates[:200], ohlc[:200])
+    adjusted = ohlc * 0.5
+    np.testing.assert_array_equal(cache.get("T", dates[:210], adjusted[:210]), build_features(adjusted[:210]))
+    np.testing.assert_array_equal(cache.get("T", dates[:210], ohlc[:210]), build_features(ohlc[:210]))
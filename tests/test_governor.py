@@ -0,0 +1,109 @@
+import pytest
+
+from yff.governor import CircuitBreaker, CircuitOpen, Governor, UpstreamError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def governor(clock, **kwargs):
+    kwargs.setdefault("retries", 0)
+    kwargs.setdefault("failure_threshold", 1)
+    kwargs.setdefault("reset_timeout", 60)
+    return Governor(rate=1000, burst=1000, clock=clock, sleep=clock.sleep, seed=0, **kwargs)
+
+
+def fail(exc):
+    def fn(*args):
+        raise exc
+    return fn
+
+
+def test_breaker_opens_and_recovers():
+    clock = FakeClock()
+    gov = governor(clock)
+    with pytest.raises(UpstreamError):
+        gov.call("info", "A", fail(UpstreamError("down")))
+    with pytest.raises(CircuitOpen):
+        gov.call("info", "A", lambda: 1)
+
+    clock.now += 61
+    assert gov.call("info", "A", lambda: 1) == 1
+    assert gov.breaker("info").state == CircuitBreaker.CLOSED
+
+
+def test_non_retryable_probe_releases_half_open_breaker():
+    clock = FakeClock()
+    gov = governor(clock)
+    with pytest.raises(UpstreamError):
+        gov.call("info", "A", fail(UpstreamError("down")))
+
+    clock.now += 61
+    with pytest.raises(KeyError):
+        gov.call("info", "B", fail(KeyError("B")))
+    assert gov.call("info", "C", lambda: 3) == 3
+    assert gov.breaker("info").state == CircuitBreaker.CLOSED
+
+
+def test_non_retryable_error_is_not_retried_or_counted():
+    clock = FakeClock()
+    gov = governor(clock, retries=3, failure_threshold=2)
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            gov.call("info", "X", fail(KeyError("X")))
+    assert gov.counts["attempts"] == 3
+    assert gov.breaker("info").state == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_reopens_breaker():
+    clock = FakeClock()
+    gov = governor(clock)
+    with pytest.raises(UpstreamError):
+        gov.call("info", "A", fail(UpstreamError("down")))
+
+    clock.now += 61
+    with pytest.raises(UpstreamError):
+        gov.call("info", "A", fail(UpstreamError("still down")))
+    with pytest.raises(CircuitOpen):
+        gov.call("info", "A", lambda: 1)
+
+
+def test_last_good_result_served_while_open():
+    clock = FakeClock()
+    gov = governor(clock)
+    assert gov.call("quotes", ("A",), lambda: {"A": 1}) == {"A": 1}
+    assert gov.call("quotes", ("A",), fail(UpstreamError("down"))) == {"A": 1}
+    assert gov.call("quotes", ("A",), lambda: {"A": 2}) == {"A": 1}
+    assert gov.counts["rejected"] == 1
+
+
+def test_network_errors_are_retried_and_open_breaker():
+    from curl_cffi.requests.exceptions import ConnectionError as CurlConnectionError
+
+    clock = FakeClock()
+    gov = governor(clock, retries=2)
+    with pytest.raises(CurlConnectionError):
+        gov.call("quotes", ("A",), fail(CurlConnectionError("reset by peer")))
+    assert gov.counts["attempts"] == 3
+    assert gov.breaker("quotes").state == CircuitBreaker.OPEN
+
+
+def test_interrupted_probe_frees_half_open_breaker():
+    clock = FakeClock()
+    gov = governor(clock)
+    with pytest.raises(UpstreamError):
+        gov.call("info", "A", fail(UpstreamError("down")))
+
+    clock.now += 61
+    with pytest.raises(KeyboardInterrupt):
+        gov.call("info", "A", fail(KeyboardInterrupt()))
+    assert gov.breaker("info").state == CircuitBreaker.HALF_OPEN
+    assert gov.call("info", "A", lambda: 1) == 1
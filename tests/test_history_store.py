@@ -0,0 +1,76 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from yff.history_store import HistoryStore
+from yff.providers import DataProvider
+
+
+class AdjustingProvider(DataProvider):
+    # One bar per business day; `factor` re-bases every bar before
+    # `adjusted_before`, as an adjusted upstream does after a split.
+    name = "adjusting"
+
+    def __init__(self):
+        self.factor = 1.0
+        self.adjusted_before = None
+        self.failing = False
+        self.requests = []
+
+    def info(self, ticker):
+        return {}
+
+    def history(self, ticker, start, end):
+        self.requests.append((ticker, pd.Timestamp(start).date()))
+        index = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1), name="Date")
+        if self.failing:
+            index = index[:0]
+        close = 100.0 + (index - pd.Timestamp("2026-01-01")).days.to_numpy()
+        if self.adjusted_before is not None:
+            close = np.where(index < pd.Timestamp(self.adjusted_before), close * self.factor, close)
+        return pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1000.0},
+                            index=index)
+
+
+def test_tail_is_appended_and_checked_once(tmp_path):
+    provider = AdjustingProvider()
+    store = HistoryStore(str(tmp_path), provider=provider)
+    store.fetch("A", "2026-01-01", "2026-02-01")
+    store.fetch("A", "2026-01-01", "2026-02-01")
+    store.fetch("A", "2026-01-01", "2026-02-10")
+    assert provider.requests == [("A", datetime.date(2026, 1, 1)), ("A", datetime.date(2026, 1, 30))]
+    assert len(store.load("A")) == len(pd.bdate_range("2026-01-01", "2026-02-09"))
+
+
+def test_failed_download_is_asked_again(tmp_path):
+    provider = AdjustingProvider()
+    provider.failing = True
+    store = HistoryStore(str(tmp_path), provider=provider)
+    assert store.fetch("A", "2026-01-01", "2026-02-01").empty
+    provider.failing = False
+    assert len(store.fetch("A", "2026-01-01", "2026-02-01")) == len(pd.bdate_range("2026-01-01", "2026-01-31"))
+
+
+def test_weekend_is_checked_once(tmp_path):
+    provider = AdjustingProvider()
+    store = HistoryStore(str(tmp_path), provider=provider)
+    store.fetch("A", "2026-01-03", "2026-01-05")
+    store.fetch("A", "2026-01-03", "2026-01-05")
+    assert len(provider.requests) == 1
+
+
+def test_rebased_history_is_rewritten(tmp_path):
+    provider = AdjustingProvider()
+    store = HistoryStore(str(tmp_path), provider=provider)
+    store.fetch_many(["A", "B"], "2026-01-01", "2026-02-01")
+    provider.factor, provider.adjusted_before = 0.5, "2026-02-02"
+    frames = store.fetch_many(["A", "B"], "2026-01-01", "2026-02-10")
+    expected = provider.history("A", "2026-01-01", "2026-02-10")["Close"].to_numpy()
+    for frame in frames.values():
+        np.testing.assert_array_equal(frame["Close"].to_numpy(), expected)
+
+    provider.factor, provider.adjusted_before = 0.25, "2026-02-12"
+    frame = store.fetch("A", "2026-01-01", "2026-02-20")
+    np.testing.assert_array_equal(frame["Close"].to_numpy(),
+                                  provider.history("A", "2026-01-01", "2026-02-20")["Close"].to_numpy())
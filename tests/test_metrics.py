@@ -0,0 +1,23 @@
+import threading
+
+from yff import metrics
+
+
+def test_serve_starts_one_server(monkeypatch):
+    monkeypatch.setattr(metrics, "_server", None)
+    barrier = threading.Barrier(8)
+    servers = []
+
+    def start():
+        barrier.wait()
+        servers.append(metrics.serve(0))
+    threads = [threading.Thread(target=start) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    try:
+        assert len({id(server) for server in servers}) == 1
+    finally:
+        servers[0].shutdown()
+        servers[0].server_close()
@@ -0,0 +1,25 @@
+import os
+
+from yff.model_store import ModelStore
+
+
+def test_disk_cache_stays_under_budget(tmp_path):
+    store = ModelStore(str(tmp_path), max_models=1, max_disk_bytes=250_000)
+    for i in range(6):
+        store.get_or_train(f"T{i}", ("2021-01-01", "2026-01-01"), {}, "2026-01-01", lambda: bytes(100_000))
+    sizes = [os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path)]
+    assert len(sizes) == 2 and sum(sizes) <= 250_000
+
+
+def test_disk_hit_survives_pruning(tmp_path):
+    store = ModelStore(str(tmp_path), max_models=1, max_disk_bytes=250_000)
+    train = lambda: bytes(100_000)
+    store.get_or_train("A", "w", {}, "d", train)
+    store.get_or_train("B", "w", {}, "d", train)
+    old = os.path.getmtime(store._path(store.key("B", "w", {})))
+    os.utime(store._path(store.key("A", "w", {})), (old + 10, old + 10))
+    store.get_or_train("C", "w", {}, "d", train)
+
+    _, report = ModelStore(str(tmp_path)).get_or_train("A", "w", {}, "d", train)
+    assert report["source"] == "disk"
+    assert not os.path.exists(store._path(store.key("B", "w", {})))
@@ -0,0 +1,8 @@
+import pkgutil
+
+import yff
+
+
+def test_exports_do_not_shadow_submodules():
+    submodules = {module.name for module in pkgutil.iter_modules(yff.__path__)}
+    assert not submodules & set(yff._EXPORTS)
@@ -0,0 +1,95 @@
+import logging
+import time
+
+import pandas as pd
+import pytest
+
+from yff import providers
+from yff.governor import RateLimited, UpstreamError
+
+
+def empty_download(message=None):
+    def download(tickers, **kwargs):
+        if message:
+            logging.getLogger("yfinance").error(message)
+        return pd.DataFrame()
+    return download
+
+
+def test_small_empty_quote_batch_is_not_retried(monkeypatch):
+    monkeypatch.setattr(providers.yf, "download", empty_download())
+    assert providers.YahooProvider().quotes(["03051.KL"]) == {}
+
+
+def test_large_empty_quote_batch_is_retried(monkeypatch):
+    monkeypatch.setattr(providers.yf, "download", empty_download())
+    tickers = [f"{i:04d}.KL" for i in range(providers.EMPTY_BATCH_RETRY)]
+    with pytest.raises(UpstreamError):
+        providers.YahooProvider().quotes(tickers)
+
+
+def test_rate_limited_empty_quote_batch(monkeypatch):
+    message = "['1155.KL']: YFRateLimitError('Too Many Requests. Rate limited. Try after a while.')"
+    monkeypatch.setattr(providers.yf, "download", empty_download(message))
+    with pytest.raises(RateLimited):
+        providers.YahooProvider().quotes(["1155.KL"])
+
+
+def test_rate_limited_history_is_raised(monkeypatch):
+    message = "['1155.KL']: YFRateLimitError('Too Many Requests. Rate limited. Try after a while.')"
+    monkeypatch.setattr(providers.yf, "download", empty_download(message))
+    provider = providers.YahooProvider()
+    with pytest.raises(RateLimited):
+        provider.history("1155.KL", "2026-01-01", "2026-02-01")
+    with pytest.raises(RateLimited):
+        provider.history_many(["1155.KL", "1023.KL"], "2026-01-01", "2026-02-01")
+
+
+def test_empty_sector_does_not_open_quotes_breaker(monkeypatch):
+    monkeypatch.setattr(providers.yf, "download", empty_download())
+    provider = providers.GovernedProvider(providers.YahooProvider(), providers.Governor(sleep=lambda s: None))
+    for _ in range(10):
+        assert provider.quotes(["03051.KL"]) == {}
+    assert provider.governor.breaker("quotes").state == "closed"
+
+
+def test_replay_miss_is_not_retried(tmp_path):
+    path = str(tmp_path / "session.bin")
+    providers.RecordingProvider(providers.FakeProvider(), path).quotes(["1155.KL"])
+    sleeps = []
+    governor = providers.Governor(sleep=sleeps.append)
+    provider = providers.GovernedProvider(providers.ReplayProvider(path, scale=0), governor)
+    with pytest.raises(LookupError):
+        provider.info("1155.KL")
+    assert governor.counts["attempts"] == 1 and not sleeps
+    assert provider.quotes(["1155.KL"]).keys() == {"1155.KL"}
+
+
+def test_history_is_adjusted_and_quotes_are_not(monkeypatch):
+    calls = []
+
+    def download(tickers, **kwargs):
+        calls.append(kwargs)
+        return pd.DataFrame()
+    monkeypatch.setattr(providers.yf, "download", download)
+    provider = providers.YahooProvider()
+    provider.history("1155.KL", "2026-01-01", "2026-02-01")
+    provider.history_many(["1155.KL", "1023.KL"], "2026-01-01", "2026-02-01")
+    provider.quotes(["1155.KL"])
+    assert [kwargs["auto_adjust"] for kwargs in calls] == [True, True, False]
+
+
+def test_paced_replay_keeps_recorded_schedule(tmp_path):
+    path = str(tmp_path / "session.bin")
+    recorder = providers.RecordingProvider(providers.FakeProvider(), path)
+    for ticker in ("1155.KL", "1023.KL", "1295.KL"):
+        recorder.quotes([ticker])
+        time.sleep(0.2)
+
+    for paced, at_least, below in ((False, 0.0, 0.2), (True, 0.4, None)):
+        replay = providers.ReplayProvider(path, scale=1.0, paced=paced)
+        start = time.monotonic()
+        for ticker in ("1155.KL", "1023.KL", "1295.KL"):
+            replay.quotes([ticker])
+        elapsed = time.monotonic() - start
+        assert elapsed >= at_least and (below is None or elapsed < below)
@@ -0,0 +1,48 @@
+# Names are resolved on first access so that `import yff` stays cheap: the
+# quote path never pays for pandas/yfinance until it is used, and only the
+# Forecasting page loads scikit-learn and plotly.
+import importlib
+
+
+PAGES = {
+    "Main Menu": "yff.home",
+    "View Present Stock Data": "yff.view",
+    "Compare Stock Data": "yff.compare",
+    "Screener": "yff.screener",
+    "Forecasting": "yff.forecast",
+}
+# Reachable with ?diagnostics in the URL, not listed in the sidebar.
+HIDDEN_PAGES = {
+    "Diagnostics": "yff.diagnostics",
+}
+
+# No export may share its name with a submodule: importing yff.<name>
+# binds the submodule over it on the package.
+_EXPORTS = {
+    "get_provider": "providers",
+    "set_provider": "providers",
+    "QuoteCache": "quote_cache",
+    "QuotePoller": "poller",
+    "get_registry": "registry",
+    "QuoteSnapshot": "quote_snapshot",
+    "fetch_quotes": "data",
+    "get_quotes": "data",
+    "get_stock_data": "data",
+    "quote_poller": "data",
+    "show_sector": "view",
+    "compare_sector": "compare",
+    "load_comparison": "compare",
+    "forecast_sector": "forecast",
+}
+
+__all__ = ["PAGES", "load_page"] + list(_EXPORTS)
+
+
+def load_page(name):
+    return importlib.import_module(PAGES.get(name) or HIDDEN_PAGES[name])
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
@@ -0,0 +1,127 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from .features import OHLC, from_windows
+from .fast_forest import fast_predictor
+from .forecaster import FEATURE_SPEC, FORECAST_DAYS, feature_cache, ohlc_arrays, single_core, train_model
+from .models import DEFAULT_MODEL, MODELS, default_params
+
+
+RETRAIN_EVERY = 20
+MIN_TRAIN_BARS = 500
+CLOSE = OHLC.index('Close')
+
+# Set once per worker process by _init_worker so folds only receive slice
+# bounds, not copies of the feature matrix.
+_shared = {}
+
+
+def _init_worker(features, ohlc, spec, model, params, horizon):
+    _shared.update(features=features, ohlc=ohlc, spec=spec, model=model, params=params, horizon=horizon)
+
+
+def _run_fold(cutoff):
+    features, ohlc, spec = _shared["features"], _shared["ohlc"], _shared["spec"]
+    params, horizon = _shared["params"], _shared["horizon"]
+    width = spec.window
+
+    start = time.perf_counter()
+    model = train_model(features[:cutoff], ohlc[width:width + cutoff], params, _shared["model"], spec)
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predictor = fast_predictor(model)
+    window = ohlc[cutoff:cutoff + width].copy()
+    predicted = np.empty((horizon, len(OHLC)))
+    for day in range(horizon):
+        predicted[day] = predictor.predict(from_windows(window[None], spec))[0]
+        window = np.vstack([window[1:], predicted[day]])
+    predict_seconds = time.perf_counter() - start
+
+    actual = ohlc[width + cutoff:width + cutoff + horizon]
+    return cutoff, predicted, actual, ohlc[width + cutoff - 1, CLOSE], fit_seconds, predict_seconds
+
+
+def walk_forward(ticker, data, spec=FEATURE_SPEC, params=None, retrain_every=RETRAIN_EVERY,
+                 horizon=FORECAST_DAYS, min_train=MIN_TRAIN_BARS, max_workers=None, progress=None,
+                 model=DEFAULT_MODEL):
+    # Replays the stored history: every `retrain_every` bars a model is
+    # trained on everything before the cutoff and forecasts the next
+    # `horizon` bars recursively. Folds run in a process pool and all share
+    # the ticker's cached feature matrix.
+    # Returns (report, folds): per-horizon MAE and direction hit rate, and
+    # per-fold timings.
+    dates, ohlc = ohlc_arrays(data)
+    features = feature_cache.get(ticker, dates, ohlc, spec)[:-1]
+    cutoffs = list(range(min_train, len(features) - horizon + 1, retrain_every))
+    if not cutoffs:
+        raise ValueError(f"need at least {min_train + horizon + spec.window} bars, have {len(ohlc)}")
+
+    params = single_core(default_params(model) if params is None else params)
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=_init_worker,
+                             initargs=(features, ohlc, spec, model, params, horizon)) as pool:
+        futures = [pool.submit(_run_fold, cutoff) for cutoff in cutoffs]
+        for done, future in enumerate(as_completed(futures), start=1):
+            results.append(future.result())
+            if progress is not None:
+                progress(done, len(cutoffs))
+    results.sort(key=lambda r: r[0])
+
+    predicted = np.stack([r[1] for r in results])
+    actual = np.stack([r[2] for r in results])
+    last_close = np.array([r[3] for r in results])[:, None]
+
+    errors = np.abs(predicted - actual)
+    hits = np.sign(predicted[:, :, CLOSE] - last_close) == np.sign(actual[:, :, CLOSE] - last_close)
+    report = pd.DataFrame({
+        "Horizon": np.arange(1, horizon + 1),
+        "MAE Close": errors[:, :, CLOSE].mean(axis=0),
+        "MAE OHLC": errors.mean(axis=(0, 2)),
+        "Direction Hit Rate": hits.mean(axis=0),
+    })
+
+    folds = pd.DataFrame({
+        "Cutoff": [pd.Timestamp(dates[spec.window + r[0] - 1]) for r in results],
+        "Train Rows": [r[0] for r in results],
+        "Fit (s)": [r[4] for r in results],
+        "Predict (s)": [r[5] for r in results],
+        "MAE Close": errors[:, :, CLOSE].mean(axis=1),
+    })
+    return report, folds
+
+
+def compare_models(ticker, data, names=None, spec=FEATURE_SPEC, retrain_every=RETRAIN_EVERY,
+                   max_workers=None, progress=None):
+    # Backtests each registered model on the same folds and returns one row
+    # per model with its average fit time, 30-day path predict time and
+    # errors, cheapest fit first.
+    rows = []
+    for name in names or MODELS:
+        report, folds = walk_forward(ticker, data, spec, retrain_every=retrain_every,
+                                     max_workers=max_workers, model=name)
+        rows.append({
+            "Model": name,
+            "Fit (s)": folds["Fit (s)"].mean(),
+            "Predict (ms)": folds["Predict (s)"].mean() * 1000,
+            "MAE Close 1d": report["MAE Close"].iloc[0],
+            "MAE Close 30d": report["MAE Close"].iloc[-1],
+            "MAE Close": report["MAE Close"].mean(),
+            "Direction Hit Rate": report["Direction Hit Rate"].mean(),
+        })
+        if progress is not None:
+            progress(name)
+    return pd.DataFrame(rows).sort_values("Fit (s)", kind="mergesort").reset_index(drop=True)
+
+
+def pick_model(comparison, tolerance=0.05):
+    # Cheapest model whose mean Close MAE is within `tolerance` (relative)
+    # of the most accurate one.
+    best = comparison["MAE Close"].min()
+    good_enough = comparison[comparison["MAE Close"] <= best * (1 + tolerance)]
+    return good_enough.sort_values("Fit (s)", kind="mergesort")["Model"].iloc[0]
@@ -0,0 +1,105 @@
+import datetime
+import time
+
+import streamlit as st
+
+from .data import NAME_WAIT, get_stock_data
+from .metrics import span
+from .registry import get_registry
+from .widgets import sector_picker
+
+
+def load_comparison(selections, provider=None):
+    # One batched fetch for the union of every (market, sector) selection, so
+    # a ticker listed in both sectors is requested once. Returns one frame
+    # per selection, each in get_stock_data's order. The page is not
+    # refreshed, so it waits up to NAME_WAIT for names on a cold cache.
+    registry = get_registry()
+    groups = [registry.tickers(market, sector) if sector else [] for market, sector in selections]
+    union = list(dict.fromkeys(ticker for tickers in groups for ticker in tickers))
+    if not union:
+        return [None for _ in groups]
+
+    with span("compare_fetch"):
+        df = get_stock_data(union, provider=provider, names_timeout=NAME_WAIT)
+        return [df[df["Ticker"].isin(tickers)] if tickers else None for tickers in groups]
+
+
+def filter_by_price(df, max_price, column="Open"):
+    with span("compare_filter"):
+        return df[(df[column] <= max_price)]
+
+
+def show_comparison(df, invest_amount):
+    if df is None:
+        st.info("Please select a sector to load tickers.")
+        return
+    st.dataframe(filter_by_price(df, invest_amount), use_container_width=True)
+
+
+def compare_sector(market, invest_amount, sector):
+    df, = load_comparison([(market, sector)])
+    show_comparison(df, invest_amount)
+
+
+def render(refresh_rate):
+    col6, col7 = st.columns([0.8, 0.2])
+
+    if "max_range" not in st.session_state:
+        st.session_state.max_range = 80.000
+
+    if "min_range" not in st.session_state:
+        st.session_state.min_range = 0.000
+
+    with col7:
+        num_input = st.text_input(
+            "Enter max unit price", value=st.session_state.max_range
+        )
+        if num_input.replace('.', '', 1).isdigit():
+            st.session_state.max_range = float(num_input)
+
+    with col6:
+        invest_amount = st.slider(
+            "Please select an **amount range** you want to invest in (Open price).",
+            min_value=0.000,
+            max_value=80.000,
+            value=st.session_state.max_range,
+            step=0.001,
+            key="max_range_slider"
+        )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        col_market, col_sector = st.columns(2)
+        market_options, options = sector_picker(col_market, col_sector, "compare_1")
+
+    with col2:
+        col_market2, col_sector2 = st.columns(2)
+        market_options2, options2 = sector_picker(col_market2, col_sector2, "compare_2")
+
+    col_left, col_button, col_right = st.columns([1, 0.2, 1])
+    with col_button:
+        confirm = st.button("Confirm")       
+
+    # Quotes are fetched only on Confirm and kept in the session; moving the
+    # slider or typing a new max price re-filters the stored frames.
+    if confirm:
+        selections = ((market_options, options), (market_options2, options2))
+        st.session_state.comparison = {
+            "selections": selections,
+            "frames": load_comparison(selections),
+            "loaded_at": time.time(),
+        }
+
+    comparison = st.session_state.get("comparison")
+    if comparison is None:
+        return
+
+    col4, col5 = st.columns(2)
+
+    for column, df in zip((col4, col5), comparison["frames"]):
+        with column:
+            show_comparison(df, invest_amount)
+
+    loaded_at = datetime.datetime.fromtimestamp(comparison["loaded_at"]).strftime("%H:%M:%S")
+    st.caption(f"Prices as of {loaded_at}. Press Confirm to refresh.")
@@ -0,0 +1,248 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .metrics import metrics, span
+from .providers import get_provider
+from .quote_cache import QuoteCache
+from .poller import QuotePoller
+from .quote_snapshot import QuoteSnapshot
+
+
+MAX_WORKERS = 8
+REQUEST_TIMEOUT = 15
+QUOTE_TTL = 15
+QUOTE_CACHE_SIZE = 2000
+QUOTE_CHUNK = 100
+NAME_TTL = 24 * 3600
+# A failed name lookup is cached as "" for NAME_RETRY seconds only, so it is
+# asked again later without being re-queued on every refresh.
+NAME_RETRY = 5 * 60
+# Pages that fetch once instead of refreshing (Compare) wait up to NAME_WAIT
+# seconds for names that are not cached yet.
+NAME_WAIT = 10
+# Names load in the background in groups of NAME_CHUNK with NAME_WORKERS
+# requests at a time, so a cold universe leaves most of the shared request
+# budget to the quote batches.
+NAME_CHUNK = 25
+NAME_WORKERS = 2
+
+QUOTE_FIELDS = {
+    "Name": "shortName",
+    "Current Price": "currentPrice",
+    "Open": "open",
+    "High": "dayHigh",
+    "Low": "dayLow",
+    "Close": "previousClose",
+    "Volume": "volume",
+}
+
+
+def quote_row(ticker, info):
+    row = {"Ticker": ticker}
+    for column, key in QUOTE_FIELDS.items():
+        row[column] = info.get(key, "" if column == "Name" else None)
+    return row
+
+
+def fetch_each(items, fetch, max_workers=MAX_WORKERS, timeout=REQUEST_TIMEOUT):
+    # Run fetch(item) for every item through a bounded pool. Results come
+    # back in the same order as `items`, None where the call failed or had
+    # not finished `timeout` seconds after the batch was submitted, whether
+    # it was running or still queued behind hung calls, so one slow request
+    # cannot stall or break the whole batch. Returns (results, failed).
+    items = list(items)
+    if not items:
+        return [], []
+
+    results = [None] * len(items)
+    failed = []
+    deadline = time.monotonic() + timeout
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))))
+    try:
+        futures = {pool.submit(fetch, item): i for i, item in enumerate(items)}
+        pending = set(futures)
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as exc:
+                    failed.append((items[index], repr(exc)))
+        for future in pending:
+            future.cancel()
+            failed.append((items[futures[future]], "timed out"))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results, failed
+
+
+quote_cache = QuoteCache(ttl=QUOTE_TTL, max_size=QUOTE_CACHE_SIZE, wait_timeout=REQUEST_TIMEOUT * 2)
+name_cache = QuoteCache(ttl=NAME_TTL, max_size=QUOTE_CACHE_SIZE, wait_timeout=REQUEST_TIMEOUT * 2)
+
+
+_names_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yff-names")
+_names_pending = set()
+_names_cond = threading.Condition()
+
+
+def load_names(tickers, provider=None, max_workers=MAX_WORKERS, timeout=REQUEST_TIMEOUT):
+    # Names are the only field still read from the heavy .info payload; they
+    # are cached for NAME_TTL, so each ticker pays for it about once a day.
+    # Tickers whose lookup failed are left out.
+    provider = provider or get_provider()
+    tickers = list(tickers)
+    with span("load_names"):
+        results, _ = fetch_each(tickers, provider.info, max_workers, timeout)
+    return {t: info.get("shortName") or "" for t, info in zip(tickers, results) if info is not None}
+
+
+def _warm_names(tickers, provider, timeout):
+    # The lookups were counted by fetch_quotes' peek, so they are not
+    # counted again here.
+    try:
+        for i in range(0, len(tickers), NAME_CHUNK):
+            chunk = tickers[i:i + NAME_CHUNK]
+            found = name_cache.get_many(chunk, lambda missing: load_names(missing, provider, NAME_WORKERS, timeout),
+                                        count=False)
+            name_cache.put_many({t: "" for t in chunk if t not in found}, ttl=NAME_RETRY)
+            with _names_cond:
+                _names_pending.difference_update(chunk)
+                _names_cond.notify_all()
+    finally:
+        with _names_cond:
+            _names_pending.difference_update(tickers)
+            _names_cond.notify_all()
+
+
+def warm_names(tickers, provider=None, timeout=REQUEST_TIMEOUT):
+    # Queue name lookups for `tickers` on the single background worker;
+    # tickers already queued are skipped. Rows fetched meanwhile go out with
+    # an empty Name, filled in on a later refresh.
+    with _names_cond:
+        queued = [t for t in dict.fromkeys(tickers) if t not in _names_pending]
+        _names_pending.update(queued)
+    if queued:
+        _names_pool.submit(_warm_names, queued, provider, timeout)
+
+
+def wait_for_names(tickers=None, timeout=None):
+    # Blocks until the queued name lookups for `tickers` (default: all of
+    # them) have finished; True unless it timed out.
+    wanted = None if tickers is None else set(tickers)
+    with _names_cond:
+        if wanted is None:
+            return _names_cond.wait_for(lambda: not _names_pending, timeout)
+        return _names_cond.wait_for(lambda: _names_pending.isdisjoint(wanted), timeout)
+
+
+def fill_names(rows, provider=None, timeout=NAME_WAIT):
+    # {ticker: row} with the empty Names filled in from name_cache, waiting
+    # up to `timeout` seconds for the ones still loading. Rows are copied,
+    # not changed: they may be shared through quote_cache.
+    missing = [t for t, row in rows.items() if not row["Name"]]
+    if not missing:
+        return rows
+    names = name_cache.peek_many(missing, count=False)
+    unnamed = [t for t in missing if t not in names]
+    if unnamed:
+        warm_names(unnamed, provider)
+        wait_for_names(unnamed, timeout)
+        names.update(name_cache.peek_many(unnamed, count=False))
+    return {t: {**row, "Name": names[t]} if names.get(t) else row for t, row in rows.items()}
+
+
+def fetch_quotes(tickers, provider=None, max_workers=MAX_WORKERS, timeout=REQUEST_TIMEOUT, chunk=QUOTE_CHUNK):
+    # Prices come from the provider's batched quotes() call, `chunk` symbols
+    # per request with the chunks fetched concurrently; names come from
+    # name_cache, and the ones not cached yet are queued with warm_names()
+    # instead of holding back the prices. Rows come back in the same order
+    # as `tickers`, and a ticker without a quote keeps an empty row and is
+    # reported in `failed`.
+    provider = provider or get_provider()
+    tickers = list(tickers)
+    if not tickers:
+        return [], []
+
+    def batch(group):
+        with span("quote_batch"):
+            return provider.quotes(group)
+
+    names = name_cache.peek_many(tickers)
+    warm_names([t for t in tickers if t not in names], provider, timeout)
+    chunks = [tickers[i:i + chunk] for i in range(0, len(tickers), chunk)]
+    results, failed_chunks = fetch_each(chunks, batch, max_workers, timeout)
+    reasons = {t: reason for group, reason in failed_chunks for t in group}
+    quotes = {}
+    for result in results:
+        quotes.update(result or {})
+
+    rows, failed = [], []
+    for ticker in tickers:
+        quote = quotes.get(ticker)
+        if quote is None:
+            failed.append((ticker, reasons.get(ticker, "no data")))
+            rows.append(quote_row(ticker, {}))
+        else:
+            rows.append(quote_row(ticker, {**quote, "shortName": names.get(ticker, "")}))
+    return rows, failed
+
+
+def fetch_info_quotes(tickers, provider=None, max_workers=MAX_WORKERS, timeout=REQUEST_TIMEOUT):
+    # The previous path: one full .info request per ticker. Kept as the
+    # baseline for benchmarks/quotes.py.
+    provider = provider or get_provider()
+    tickers = list(tickers)
+    results, failed = fetch_each(tickers, provider.info, max_workers, timeout)
+    rows = [quote_row(t, info or {}) for t, info in zip(tickers, results)]
+    return rows, failed
+
+
+def load_quotes(tickers, provider=None):
+    rows, failed = fetch_quotes(tickers, provider=provider)
+    if failed:
+        print(f"Warning: no quote for {len(failed)} ticker(s): " + ", ".join(t for t, _ in failed))
+    missing = {t for t, _ in failed}
+    return {row["Ticker"]: row for row in rows if row["Ticker"] not in missing}
+
+
+def get_quotes(tickers, provider=None, use_cache=True):
+    # {ticker: row} for the tickers that could be fetched.
+    if use_cache:
+        return quote_cache.get_many(tickers, lambda missing: load_quotes(missing, provider))
+    return load_quotes(tickers, provider)
+
+
+def get_stock_data(tickers, provider=None, use_cache=True, names_timeout=None):
+    # `names_timeout` is for one-shot callers: wait that long for the names
+    # still loading (see fill_names) instead of showing them empty.
+    with span("get_stock_data"):
+        snapshot = QuoteSnapshot(tickers)
+        rows = get_quotes(tickers, provider, use_cache)
+        if names_timeout:
+            rows = fill_names(rows, provider, names_timeout)
+        snapshot.update(rows)
+        return snapshot.frame(snapshot.rows("Current Price", descending=True))
+
+
+quote_poller = QuotePoller(get_quotes)
+
+
+def governor_stats():
+    governor = getattr(get_provider(), "governor", None)
+    if governor is None:
+        return {}
+    stats = governor.stats()
+    breakers = stats.pop("breakers")
+    stats.update((f"breaker_open_{endpoint}", state != "closed") for endpoint, state in breakers.items())
+    return {key: float(value) for key, value in stats.items()}
+
+
+metrics.collect("quote_cache", quote_cache.stats)
+metrics.collect("name_cache", name_cache.stats)
+metrics.collect("poller", quote_poller.stats)
+metrics.collect("governor", governor_stats)
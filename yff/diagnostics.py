@@ -0,0 +1,45 @@
+import streamlit as st
+
+from . import data  # noqa: F401  registers the cache, poller and governor gauges
+from .metrics import metrics
+
+
+def render(refresh_rate):
+    # Not in the sidebar; opened with ?diagnostics in the URL.
+    st.title("Diagnostics")
+
+    st.subheader("Spans")
+    st.dataframe([
+        {
+            "Span": name,
+            "Labels": ", ".join(f"{k}={v}" for k, v in labels.items()),
+            "Count": n,
+            "p50 (ms)": p50 * 1000,
+            "p95 (ms)": p95 * 1000,
+            "Max (ms)": worst * 1000,
+            "Total (s)": total,
+        }
+        for name, labels, n, p50, p95, worst, total in metrics.spans()
+    ], use_container_width=True)
+
+    col_counters, col_gauges = st.columns(2)
+    with col_counters:
+        st.subheader("Counters")
+        st.dataframe([
+            {"Counter": name, "Labels": ", ".join(f"{k}={v}" for k, v in labels.items()), "Value": value}
+            for name, labels, value in metrics.counters()
+        ], use_container_width=True)
+    with col_gauges:
+        st.subheader("Caches and upstream")
+        st.dataframe([
+            {"Source": source, "Metric": key, "Value": value}
+            for (source, key), value in sorted(metrics.gauges().items())
+        ], use_container_width=True)
+
+    text = metrics.prometheus()
+    with st.expander("Prometheus text"):
+        st.code(text, language="text")
+    st.download_button("Download metrics", text, file_name="metrics.txt", mime="text/plain")
+    if st.button("Reset spans and counters"):
+        metrics.reset()
+        st.rerun()
@@ -0,0 +1,93 @@
+import weakref
+
+import numpy as np
+
+
+class CompiledForest:
+    # A fitted sklearn forest flattened into contiguous node arrays so that a
+    # handful of rows can be pushed through every tree with a few NumPy ops
+    # per tree level, instead of paying sklearn's validation and joblib
+    # dispatch on every predict() call. Leaves point back to themselves, so
+    # walking max_depth levels lands every (tree, row) pair on its leaf.
+
+    def __init__(self, left, right, feature, threshold, value, roots, depth):
+        self.left = left
+        self.right = right
+        self.feature = feature
+        self.threshold = threshold
+        self.value = value
+        self.roots = roots
+        self.depth = depth
+
+    @classmethod
+    def from_sklearn(cls, forest):
+        trees = [estimator.tree_ for estimator in forest.estimators_]
+        left, right, feature, threshold, value, roots = [], [], [], [], [], []
+        offset = 0
+        for tree in trees:
+            nodes = np.arange(tree.node_count)
+            leaf = tree.children_left == -1
+            left.append(np.where(leaf, nodes, tree.children_left) + offset)
+            right.append(np.where(leaf, nodes, tree.children_right) + offset)
+            feature.append(np.where(leaf, 0, tree.feature))
+            threshold.append(np.where(leaf, np.inf, tree.threshold))
+            value.append(tree.value[:, :, 0])
+            roots.append(offset)
+            offset += tree.node_count
+
+        return cls(
+            np.concatenate(left).astype(np.intp),
+            np.concatenate(right).astype(np.intp),
+            np.concatenate(feature).astype(np.intp),
+            np.concatenate(threshold),
+            np.ascontiguousarray(np.concatenate(value)),
+            np.asarray(roots, dtype=np.intp),
+            max(tree.max_depth for tree in trees),
+        )
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def leaves(self, X):
+        # sklearn's trees test splits on float32 inputs; do the same so the
+        # chosen leaves, and therefore the predictions, are identical.
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(X.shape[0])[None, :]
+        node = np.repeat(self.roots[:, None], X.shape[0], axis=1)
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return node
+
+    def sample(self, X, trees):
+        # Prediction of one chosen tree per row: row i goes through tree
+        # trees[i] only, so the cost is one walk per row, not per forest.
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(X.shape[0])
+        node = self.roots[trees]
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return self.value[node]
+
+    def per_tree(self, X):
+        # (n_trees, rows, n_outputs) predictions of every individual tree.
+        return self.value[self.leaves(X)]
+
+    def predict(self, X):
+        return self.per_tree(X).mean(axis=0)
+
+
+_compiled = weakref.WeakKeyDictionary()
+
+
+def fast_predictor(model):
+    # Compiled version of a fitted forest, built once per model object; any
+    # other model is returned unchanged.
+    if not hasattr(model, "estimators_") or not all(hasattr(e, "tree_") for e in model.estimators_):
+        return model
+    compiled = _compiled.get(model)
+    if compiled is None:
+        compiled = _compiled[model] = CompiledForest.from_sklearn(model)
+    return compiled
@@ -0,0 +1,128 @@
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+OHLC = ['Open', 'High', 'Low', 'Close']
+CLOSE = 3
+
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    # Features for predicting bar t are computed from bars t-window..t-1:
+    #   lags           OHLC of bar t-k for each k
+    #   rolling_means  mean Close over the last w bars
+    #   rolling_vols   std of daily log returns over the last w bars
+    #   returns        Close return over the last k bars
+    lags: tuple = (1,)
+    rolling_means: tuple = ()
+    rolling_vols: tuple = ()
+    returns: tuple = ()
+
+    @property
+    def window(self):
+        return max(
+            max(self.lags, default=1),
+            max(self.rolling_means, default=1),
+            max((w + 1 for w in self.rolling_vols), default=1),
+            max((k + 1 for k in self.returns), default=1),
+        )
+
+    def names(self):
+        names = [f"{column}_Lag{k}" for k in self.lags for column in OHLC]
+        names += [f"Close_Mean{w}" for w in self.rolling_means]
+        names += [f"Close_Vol{w}" for w in self.rolling_vols]
+        names += [f"Close_Ret{k}" for k in self.returns]
+        return names
+
+
+DEFAULT_SPEC = FeatureSpec()
+
+
+def from_windows(windows, spec):
+    # windows: (rows, spec.window, 4) view, oldest bar first. Returns one
+    # feature row per window in a single preallocated matrix.
+    windows = np.asarray(windows)
+    rows, width = windows.shape[0], spec.window
+    out = np.empty((rows, len(spec.names())), dtype=float)
+    close = windows[:, :, CLOSE]
+    col = 0
+
+    for k in spec.lags:
+        out[:, col:col + 4] = windows[:, width - k, :]
+        col += 4
+    for w in spec.rolling_means:
+        out[:, col] = close[:, width - w:].mean(axis=1)
+        col += 1
+    if spec.rolling_vols:
+        log_returns = np.diff(np.log(close), axis=1)
+        for w in spec.rolling_vols:
+            out[:, col] = log_returns[:, -w:].std(axis=1)
+            col += 1
+    for k in spec.returns:
+        out[:, col] = close[:, -1] / close[:, -1 - k] - 1.0
+        col += 1
+    return out
+
+
+def build_features(ohlc, spec=DEFAULT_SPEC):
+    # ohlc: (n, 4) bars. Returns (n - window + 1, features); row i holds the
+    # features for bar i + window, so the last row is the input for the next,
+    # not yet observed, bar.
+    ohlc = np.ascontiguousarray(ohlc, dtype=float)
+    if len(ohlc) < spec.window:
+        return np.empty((0, len(spec.names())))
+    windows = sliding_window_view(ohlc, spec.window, axis=0).transpose(0, 2, 1)
+    return from_windows(windows, spec)
+
+
+class FeatureCache:
+    # Feature matrices per (ticker, spec). When the same history comes back
+    # with bars dropped from the front (the training window's start moves
+    # forward every day) and/or appended at the end, the rows for the
+    # windows it still covers are kept and only the rows for the new bars
+    # are computed.
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, ticker, dates, ohlc, spec=DEFAULT_SPEC):
+        key = (ticker, spec)
+        dates = np.asarray(dates)
+        with self._lock:
+            entry = self._entries.get(key)
+
+        n = len(ohlc)
+        if entry is not None:
+            old_dates, old_ohlc, matrix = entry
+            m = len(old_dates)
+            if m == n and np.array_equal(old_dates, dates) and np.array_equal(old_ohlc, ohlc):
+                return matrix
+            # Rows are windows of spec.window bars; the cached ones starting
+            # at or after the new first date stay valid as long as the bars
+            # they cover are the same (adjusted bars are rewritten after a
+            # split or dividend, so the prices are compared, not only dates).
+            start = int(np.searchsorted(old_dates, dates[0])) if n else m
+            kept = m - start
+            if (start < m and spec.window <= kept <= n and old_dates[start] == dates[0]
+                    and np.array_equal(old_dates[start:], dates[:kept])
+                    and np.array_equal(old_ohlc[start:], ohlc[:kept])):
+                tail = build_features(ohlc[kept - spec.window + 1:], spec)
+                matrix = np.concatenate([matrix[start:], tail])
+                self._store(key, dates, ohlc, matrix)
+                return matrix
+
+        matrix = build_features(ohlc, spec)
+        self._store(key, dates, ohlc, matrix)
+        return matrix
+
+    def _store(self, key, dates, ohlc, matrix):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (dates.copy(), np.array(ohlc, dtype=float), matrix)
+            while len(self._entries) > self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
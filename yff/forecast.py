@@ -0,0 +1,224 @@
+import datetime
+import time
+
+import pandas as pd
+import plotly.graph_objs as go
+import streamlit as st
+
+from .forecaster import (
+    OHLC, FEATURE_SPEC, TRAINING_YEARS, FORECAST_DAYS,
+    training_data, train_model, recursive_forecast, has_bands, simulate_paths, forecast_many,
+)
+from .model_store import ModelStore
+from .history_store import HistoryStore
+from .metrics import SPAN_METRIC, metrics, span
+from .backtest import RETRAIN_EVERY, walk_forward, compare_models, pick_model
+from .models import MODELS, DEFAULT_MODEL, default_params
+from .registry import get_registry
+from .widgets import sector_picker
+
+
+model_store = ModelStore()
+history_store = HistoryStore()
+
+
+def forecast_sector(model_name=DEFAULT_MODEL):
+    col_market, col_sector = st.columns(2)
+    market, sector = sector_picker(col_market, col_sector, "forecast")
+
+    if not st.button("Forecast sector"):
+        return
+
+    tickers = get_registry().tickers(market, sector)
+    end_date = datetime.date.today()
+    start_date = end_date - datetime.timedelta(days=TRAINING_YEARS * 365)
+    with st.spinner(f"Loading history for {len(tickers)} tickers..."), span("forecast_sector", stage="download"):
+        histories = history_store.fetch_many(tickers, start_date, end_date)
+
+    failed = [f"{t} (no data)" for t, data in histories.items() if data.empty]
+    histories = {t: data for t, data in histories.items() if not data.empty}
+
+    st.subheader(f"{sector}: {FORECAST_DAYS} Days Predicted OHLC")
+    progress = st.progress(0.0, text=f"Forecasting {len(histories)} tickers...")
+    table = st.empty()
+    results = []
+    started = time.perf_counter()
+    for done, (ticker, forecast_df, error) in enumerate(forecast_many(histories, model=model_name), start=1):
+        if error is None:
+            results.append(forecast_df)
+            combined_df = pd.concat(results, ignore_index=True)
+            table.dataframe(combined_df.style.format({c: "{:.2f}" for c in OHLC}), use_container_width=True)
+        else:
+            failed.append(f"{ticker} ({error})")
+        progress.progress(done / len(histories), text=f"{done}/{len(histories)} tickers forecast")
+    metrics.observe(SPAN_METRIC, time.perf_counter() - started, span="forecast_sector", stage="forecast")
+
+    if failed:
+        st.warning("No forecast for: " + ", ".join(failed))
+
+
+def forecast():
+    st.set_page_config(layout="wide")
+    st.title("OHLC Recursive Forecast")
+
+    mode = st.radio("Forecast", ("Single ticker", "Whole sector"), horizontal=True)
+    model_name = st.selectbox("Model", tuple(MODELS), index=tuple(MODELS).index(DEFAULT_MODEL))
+    params = default_params(model_name)
+    if mode == "Whole sector":
+        forecast_sector(model_name)
+        return
+
+    ticker = st.text_input("Enter Stock Ticker (e.g., 1155.KL):", "")
+
+    if ticker:
+        end_date = datetime.date.today()
+        start_date = end_date - datetime.timedelta(days=TRAINING_YEARS * 365)
+        with span("forecast", stage="download"):
+            data = history_store.fetch(ticker, start_date, end_date)
+
+        if not data.empty:
+            actual_ohlc = data[['Open', 'High', 'Low', 'Close']].copy()
+            actual_ohlc = actual_ohlc.tail(365).reset_index()
+            actual_ohlc['Type'] = 'Actual'
+            actual_ohlc = actual_ohlc[['Date', 'Open', 'High', 'Low', 'Close', 'Type']]
+
+            with span("forecast", stage="features"):
+                X, y, recent_bars, last_bar = training_data(data, FEATURE_SPEC, ticker)
+
+            window = f"{TRAINING_YEARS}y"
+            key_params = dict(params, model=model_name, features=FEATURE_SPEC.names())
+            with span("forecast", stage="fit"):
+                model, report = model_store.get_or_train(
+                    ticker, window, key_params, last_bar, lambda: train_model(X, y, params, model_name, FEATURE_SPEC)
+                )
+            st.caption(f"Model {report['source']} in {report['seconds']:.2f}s")
+
+            with span("forecast", stage="predict"):
+                forecast_df = recursive_forecast(model, recent_bars, last_bar, FEATURE_SPEC)
+
+            bands = None
+            if st.checkbox("Show uncertainty bands (Monte Carlo)"):
+                n_paths = st.select_slider(
+                    "Simulated paths", options=[500, 1000, 2000, 5000, 10000], value=2000
+                )
+                if has_bands(model):
+                    with span("forecast", stage="bands"):
+                        bands = simulate_paths(model, recent_bars, FEATURE_SPEC, n_paths=n_paths)
+                else:
+                    st.info("Uncertainty bands are only available for the random forest model.")
+
+            combined_df = pd.concat([actual_ohlc, forecast_df]).reset_index(drop=True)
+
+            st.subheader("1 Year Actual + 30 Days Predicted OHLC")
+            st.dataframe(combined_df.style.format({
+                "Open": "{:.2f}",
+                "High": "{:.2f}",
+                "Low": "{:.2f}",
+                "Close": "{:.2f}"
+            }))
+
+            st.subheader("Candlestick Chart: Actual + Predicted")
+            plot_started = time.perf_counter()
+
+            fig = go.Figure()
+
+            fig.add_trace(go.Candlestick(
+                x=combined_df[combined_df['Type'] == 'Actual']['Date'],
+                open=combined_df[combined_df['Type'] == 'Actual']['Open'],
+                high=combined_df[combined_df['Type'] == 'Actual']['High'],
+                low=combined_df[combined_df['Type'] == 'Actual']['Low'],
+                close=combined_df[combined_df['Type'] == 'Actual']['Close'],
+                increasing_line_color='green',
+                decreasing_line_color='red',
+                name='Actual OHLC'
+            ))
+
+            fig.add_trace(go.Candlestick(
+                x=combined_df[combined_df['Type'] == 'Predicted']['Date'],
+                open=combined_df[combined_df['Type'] == 'Predicted']['Open'],
+                high=combined_df[combined_df['Type'] == 'Predicted']['High'],
+                low=combined_df[combined_df['Type'] == 'Predicted']['Low'],
+                close=combined_df[combined_df['Type'] == 'Predicted']['Close'],
+                increasing_line_color='lightgreen',
+                decreasing_line_color='lightcoral',
+                name='Predicted OHLC'
+            ))
+
+            if bands is not None:
+                future_dates = forecast_df['Date']
+                close = OHLC.index('Close')
+                for low, high, color in ((5, 95, 'rgba(255, 165, 0, 0.15)'), (25, 75, 'rgba(255, 165, 0, 0.30)')):
+                    fig.add_trace(go.Scatter(
+                        x=future_dates, y=bands[high][:, close],
+                        mode='lines', line=dict(width=0), hoverinfo='skip', showlegend=False
+                    ))
+                    fig.add_trace(go.Scatter(
+                        x=future_dates, y=bands[low][:, close],
+                        mode='lines', line=dict(width=0), fill='tonexty', fillcolor=color,
+                        name=f'Close {low}-{high}% band'
+                    ))
+                fig.add_trace(go.Scatter(
+                    x=future_dates, y=bands[50][:, close],
+                    mode='lines', line=dict(color='orange', dash='dot'), name='Median simulated Close'
+                ))
+
+            fig.update_layout(
+                title=f"{ticker} - 1 Year Actual + 30 Days Forecast",
+                xaxis_title='Date',
+                yaxis_title='Price',
+                xaxis_rangeslider_visible=True,
+                autosize=False,
+                width=1200,
+                height=800,
+                margin=dict(l=50, r=50, t=50, b=50)
+            )
+
+            st.plotly_chart(fig)
+            metrics.observe(SPAN_METRIC, time.perf_counter() - plot_started, span="forecast", stage="plot")
+
+            with st.expander("Walk-forward backtest"):
+                retrain_every = st.number_input(
+                    "Retrain every (bars)", min_value=5, max_value=250, value=RETRAIN_EVERY, step=5
+                )
+                if st.button("Run backtest"):
+                    bar = st.progress(0.0, text="Running folds...")
+                    try:
+                        report, folds = walk_forward(
+                            ticker, data, FEATURE_SPEC, params, retrain_every=int(retrain_every),
+                            progress=lambda done, total: bar.progress(done / total, text=f"{done}/{total} folds"),
+                            model=model_name,
+                        )
+                    except ValueError as exc:
+                        st.warning(f"Not enough history to backtest: {exc}")
+                    else:
+                        st.dataframe(report.style.format({
+                            "MAE Close": "{:.4f}", "MAE OHLC": "{:.4f}", "Direction Hit Rate": "{:.1%}"
+                        }), use_container_width=True)
+                        st.dataframe(folds, use_container_width=True)
+                        st.caption(
+                            f"{len(folds)} folds, {folds['Fit (s)'].sum():.1f}s fitting, "
+                            f"{folds['Predict (s)'].sum():.2f}s predicting"
+                        )
+
+                if st.button("Compare models"):
+                    status = st.empty()
+                    try:
+                        comparison = compare_models(
+                            ticker, data, spec=FEATURE_SPEC, retrain_every=int(retrain_every),
+                            progress=lambda name: status.caption(f"Backtested {name}"),
+                        )
+                    except ValueError as exc:
+                        st.warning(f"Not enough history to backtest: {exc}")
+                    else:
+                        st.dataframe(comparison.style.format({
+                            "Fit (s)": "{:.3f}", "Predict (ms)": "{:.2f}", "MAE Close 1d": "{:.4f}",
+                            "MAE Close 30d": "{:.4f}", "MAE Close": "{:.4f}", "Direction Hit Rate": "{:.1%}"
+                        }), use_container_width=True)
+                        st.success(f"Cheapest model within 5% of the best error: {pick_model(comparison)}")
+
+        else:
+            st.error("No data retrieved. Please check your stock ticker.")
+
+
+def render(refresh_rate):
+    forecast()
@@ -0,0 +1,138 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+
+from .features import OHLC, DEFAULT_SPEC, FeatureCache, build_features, from_windows
+from .fast_forest import CompiledForest, fast_predictor
+from .models import DEFAULT_MODEL, build_model, default_params
+
+
+TRAINING_YEARS = 5
+FORECAST_DAYS = 30
+MODEL_PARAMS = default_params(DEFAULT_MODEL)
+FEATURE_SPEC = DEFAULT_SPEC
+MIN_TRAINING_BARS = 60
+BAND_PERCENTILES = (5, 25, 50, 75, 95)
+PATH_CHUNK = 1000
+
+feature_cache = FeatureCache()
+
+
+def ohlc_arrays(data):
+    frame = data[OHLC].dropna()
+    dates = frame.index.values.astype("datetime64[D]")
+    return dates, np.ascontiguousarray(frame.to_numpy(dtype=float))
+
+
+def training_data(data, spec=FEATURE_SPEC, ticker=None):
+    # Returns (X, y, next_window, last_date): features and OHLC targets for
+    # every bar with a full lookback window, the trailing window of bars the
+    # recursive forecast starts from, and the date of the last bar.
+    dates, ohlc = ohlc_arrays(data)
+    if ticker is None:
+        features = build_features(ohlc, spec)
+    else:
+        features = feature_cache.get(ticker, dates, ohlc, spec)
+    X = features[:-1]
+    y = ohlc[spec.window:]
+    return X, y, ohlc[-spec.window:], pd.Timestamp(dates[-1])
+
+
+def train_model(X, y, params=None, model=DEFAULT_MODEL, spec=FEATURE_SPEC):
+    estimator = build_model(model, params, spec)
+    estimator.fit(np.asarray(X, dtype=float), np.asarray(y, dtype=float))
+    if isinstance(estimator, RandomForestRegressor):
+        # The fit spreads trees over n_jobs cores, but prediction is
+        # single-row and recursive, where thread dispatch costs more than it
+        # saves.
+        estimator.set_params(n_jobs=1)
+    return estimator
+
+
+def recursive_forecast(model, window, last_date, spec=FEATURE_SPEC, n_days=FORECAST_DAYS):
+    predictor = fast_predictor(model)
+    window = np.array(window, dtype=float)
+    forecast_list = []
+
+    for i in range(1, n_days + 1):
+        features = from_windows(window[None], spec)
+        next_day = predictor.predict(features).flatten()
+        forecast_list.append(next_day)
+        window = np.vstack([window[1:], next_day])
+
+    forecast_df = pd.DataFrame(forecast_list, columns=OHLC)
+    forecast_df['Date'] = [last_date + pd.Timedelta(days=i) for i in range(1, n_days + 1)]
+    forecast_df['Type'] = 'Predicted'
+    return forecast_df[['Date'] + OHLC + ['Type']]
+
+
+def single_core(params):
+    return dict(params, n_jobs=1) if "n_jobs" in params else dict(params)
+
+
+def has_bands(model):
+    # Whether simulate_paths() can run on `model`: it needs a forest's trees.
+    return isinstance(fast_predictor(model), CompiledForest)
+
+
+def simulate_paths(model, window, spec=FEATURE_SPEC, n_days=FORECAST_DAYS, n_paths=2000,
+                   percentiles=BAND_PERCENTILES, chunk=PATH_CHUNK, seed=42):
+    # Monte Carlo version of recursive_forecast. Each path draws one tree of
+    # the forest per day and feeds that tree's prediction back in, so the
+    # spread of the paths reflects how much the trees disagree as the
+    # forecast compounds. Paths advance together as (chunk, window, 4)
+    # arrays; only `chunk` paths are in flight at a time.
+    # Returns {percentile: (n_days, 4) array}.
+    if not has_bands(model):
+        raise TypeError("uncertainty bands need a fitted forest model")
+    predictor = fast_predictor(model)
+
+    rng = np.random.default_rng(seed)
+    window = np.asarray(window, dtype=float)
+    paths = np.empty((n_paths, n_days, len(OHLC)), dtype=np.float32)
+
+    for lo in range(0, n_paths, chunk):
+        hi = min(lo + chunk, n_paths)
+        windows = np.repeat(window[None], hi - lo, axis=0)
+        for day in range(n_days):
+            trees = rng.integers(0, predictor.n_trees, hi - lo)
+            next_day = predictor.sample(from_windows(windows, spec), trees)
+            paths[lo:hi, day] = next_day
+            windows = np.concatenate([windows[:, 1:], next_day[:, None, :]], axis=1)
+
+    bands = np.percentile(paths, percentiles, axis=0)
+    return dict(zip(percentiles, bands))
+
+
+def forecast_ticker(ticker, data, params=None, n_days=FORECAST_DAYS, spec=FEATURE_SPEC,
+                    model=DEFAULT_MODEL):
+    X, y, window, last_date = training_data(data, spec)
+    if len(X) < MIN_TRAINING_BARS:
+        raise ValueError(f"only {len(X)} bars of history")
+    model = train_model(X, y, params, model, spec)
+    forecast_df = recursive_forecast(model, window, last_date, spec, n_days)
+    forecast_df.insert(0, 'Ticker', ticker)
+    return forecast_df.drop(columns='Type')
+
+
+def forecast_many(histories, params=None, n_days=FORECAST_DAYS, max_workers=None, spec=FEATURE_SPEC,
+                  model=DEFAULT_MODEL):
+    # Trains and forecasts every ticker in its own worker process and yields
+    # (ticker, forecast_df, error) as each one finishes. Each worker fits with
+    # n_jobs=1 since the pool already spreads tickers across the cores.
+    params = single_core(default_params(model) if params is None else params)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+        futures = {
+            pool.submit(forecast_ticker, ticker, data, params, n_days, spec, model): ticker
+            for ticker, data in histories.items()
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                yield ticker, future.result(), None
+            except Exception as exc:
+                yield ticker, None, exc
@@ -0,0 +1,213 @@
+import random
+import threading
+import time
+from collections import OrderedDict
+
+from .metrics import count
+
+
+class UpstreamError(Exception):
+    # A transient upstream failure worth retrying (empty or broken response).
+    pass
+
+
+class RateLimited(UpstreamError):
+    # HTTP 429 or the provider's equivalent.
+    pass
+
+
+class CircuitOpen(Exception):
+    pass
+
+
+class TokenBucket:
+    # Shared request budget: `rate` tokens per second, up to `burst` saved.
+    # slow_down() halves the rate after a 429 and speed_up() wins it back
+    # a step at a time on success, so the pace adapts to what the upstream
+    # currently accepts.
+
+    def __init__(self, rate, burst, min_rate=0.25, clock=time.monotonic, sleep=time.sleep):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._stamp = clock()
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    def slow_down(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def speed_up(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class CircuitBreaker:
+    # Opens after `threshold` consecutive failures and rejects calls for
+    # `reset_timeout` seconds; then lets a single probe through (half-open)
+    # and closes again if it succeeds.
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, threshold=5, reset_timeout=60, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self.state, self._probing = self.HALF_OPEN, False
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def success(self):
+        with self._lock:
+            self.state, self.failures, self._probing = self.CLOSED, 0, False
+
+    def release(self):
+        # The probe ended without an answer either way (e.g. interrupted):
+        # let the next call probe instead.
+        with self._lock:
+            self._probing = False
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                self.state, self._opened_at, self._probing = self.OPEN, self._clock(), False
+
+
+class Governor:
+    # Every upstream request goes through call(endpoint, key, fn, ...):
+    #   - one token bucket shared by all endpoints and sessions paces them;
+    #   - retryable errors are retried with full-jitter exponential backoff,
+    #     so sessions that failed together do not retry together;
+    #   - a circuit breaker per endpoint stops calling a failing endpoint;
+    #   - while the breaker is open, or once retries are exhausted, the last
+    #     good result for the same (endpoint, key) is served instead.
+    # Network errors are OSErrors (requests' and curl_cffi's included) and
+    # are retried with the UpstreamErrors. Other errors (e.g. an unknown
+    # ticker) are raised as they are and count as an answer from the
+    # upstream, not against the breaker.
+
+    def __init__(self, rate=4.0, burst=8, retries=3, base_delay=0.5, max_delay=8.0,
+                 failure_threshold=5, reset_timeout=60, retry_on=(UpstreamError, OSError),
+                 rate_limit_on=(RateLimited,), max_saved=4096, clock=time.monotonic, sleep=time.sleep, seed=None):
+        self.bucket = TokenBucket(rate, burst, clock=clock, sleep=sleep)
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.retry_on = tuple(retry_on)
+        self.rate_limit_on = tuple(rate_limit_on)
+        self.max_saved = max_saved
+        self.counts = dict.fromkeys(
+            ("calls", "attempts", "retries", "rate_limited", "failed", "stale", "rejected"), 0
+        )
+        self._breakers = {}
+        self._saved = OrderedDict()
+        self._clock = clock
+        self._sleep = sleep
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def breaker(self, endpoint):
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout, self._clock
+                )
+            return breaker
+
+    def backoff(self, attempt):
+        with self._lock:
+            return self._random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _count(self, name, endpoint):
+        # "attempts" are the requests that actually reached the upstream.
+        with self._lock:
+            self.counts[name] += 1
+        count(f"yff_upstream_{name}_total", endpoint=endpoint)
+
+    def _last_good(self, endpoint, key, error):
+        with self._lock:
+            entry = self._saved.get((endpoint, key))
+        if entry is None:
+            raise error
+        self._count("stale", endpoint)
+        return entry
+
+    def call(self, endpoint, key, fn, *args, **kwargs):
+        self._count("calls", endpoint)
+        breaker = self.breaker(endpoint)
+        if not breaker.allow():
+            self._count("rejected", endpoint)
+            return self._last_good(endpoint, key, CircuitOpen(f"{endpoint}: circuit open"))
+
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            self._count("attempts", endpoint)
+            try:
+                result = fn(*args, **kwargs)
+            except self.retry_on as exc:
+                if isinstance(exc, self.rate_limit_on):
+                    self._count("rate_limited", endpoint)
+                    self.bucket.slow_down()
+                if attempt == self.retries or not breaker.allow():
+                    self._count("failed", endpoint)
+                    breaker.failure()
+                    return self._last_good(endpoint, key, exc)
+                self._count("retries", endpoint)
+                self._sleep(self.backoff(attempt))
+                continue
+            except Exception:
+                # Not retryable (e.g. an unknown ticker): the upstream did
+                # answer. Recording that also hands back the half-open probe
+                # slot, which would otherwise stay taken and keep the
+                # endpoint rejected for good.
+                breaker.success()
+                raise
+            except BaseException:
+                breaker.release()
+                raise
+
+            breaker.success()
+            self.bucket.speed_up()
+            with self._lock:
+                self._saved[(endpoint, key)] = result
+                self._saved.move_to_end((endpoint, key))
+                while len(self._saved) > self.max_saved:
+                    self._saved.popitem(last=False)
+            return result
+
+    def stats(self):
+        with self._lock:
+            breakers = {endpoint: breaker.state for endpoint, breaker in self._breakers.items()}
+            return {**self.counts, "rate": self.bucket.rate, "breakers": breakers}
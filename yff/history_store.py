@@ -0,0 +1,220 @@
+import datetime
+import os
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .providers import get_provider
+
+
+# Bars live in the user cache directory next to the models (see
+# model_store); YFF_HISTORY_DIR moves them.
+HISTORY_DIR = os.environ.get("YFF_HISTORY_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "yff", "history"
+)
+
+BAR_DTYPE = np.dtype([
+    ("date", "<i8"),
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("volume", "<f8"),
+])
+COLUMNS = {"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"}
+# How far the provider's close for a stored bar may drift (float noise)
+# before the ticker counts as re-based.
+REBASE_RTOL = 1e-6
+
+
+def _day(value):
+    return int(np.datetime64(pd.Timestamp(value).date(), "D").astype(np.int64))
+
+
+class HistoryStore:
+    # Daily bars per ticker in an append-only file of fixed-size records
+    # (BAR_DTYPE, dates as days since epoch). Reads memory-map the file and
+    # binary-search the date column, so a range query only touches the pages
+    # it returns. update() asks the provider for the missing tail only, and
+    # rewrites the file when the provider has re-based (adjusted) the bars
+    # already stored.
+
+    def __init__(self, directory=HISTORY_DIR, provider=None):
+        self.directory = directory
+        self.provider = provider
+        self._checked = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def _path(self, ticker):
+        return os.path.join(self.directory, re.sub(r"[^A-Za-z0-9_.-]", "_", ticker) + ".bin")
+
+    def _ticker_lock(self, ticker):
+        with self._lock:
+            return self._locks.setdefault(ticker, threading.Lock())
+
+    def _bars(self, ticker):
+        path = self._path(ticker)
+        if not os.path.exists(path) or os.path.getsize(path) < BAR_DTYPE.itemsize:
+            return np.empty(0, dtype=BAR_DTYPE)
+        count = os.path.getsize(path) // BAR_DTYPE.itemsize
+        return np.memmap(path, dtype=BAR_DTYPE, mode="r", shape=(count,))
+
+    def _date(self, ticker, index):
+        bars = self._bars(ticker)
+        if not len(bars):
+            return None
+        return datetime.date(1970, 1, 1) + datetime.timedelta(days=int(bars["date"][index]))
+
+    def first_date(self, ticker):
+        return self._date(ticker, 0)
+
+    def last_date(self, ticker):
+        return self._date(ticker, -1)
+
+    def _missing_from(self, ticker, start, end):
+        # The date to fetch from, or None when the store already covers
+        # `end`. A stored ticker is fetched from its last bar, inclusive, so
+        # _rebased() can compare that bar with the provider's.
+        if self._checked.get(ticker) == end:
+            return None
+        last = self.last_date(ticker)
+        if last is None:
+            fetch_from = pd.Timestamp(start).date()
+            if fetch_from >= end:
+                self._checked[ticker] = end
+                return None
+            return fetch_from
+        if last + datetime.timedelta(days=1) >= end:
+            self._checked[ticker] = end
+            return None
+        return last
+
+    def _rebased(self, ticker, frame):
+        # Adjusted bars are rewritten upstream after every split, bonus issue
+        # or dividend. If the provider's copy of the last stored bar no
+        # longer matches ours, everything stored is on the old basis.
+        bars = self._bars(ticker)
+        if not len(bars):
+            return False
+        records = self._records(frame)
+        match = records[records["date"] == bars["date"][-1]]
+        if not len(match):
+            return False
+        return not np.isclose(match["close"][0], bars["close"][-1], rtol=REBASE_RTOL, atol=0.0)
+
+    def _rebuild_from(self, ticker, start):
+        first = self.first_date(ticker)
+        return min(first, pd.Timestamp(start).date())
+
+    def _rewrite(self, ticker, frame, end):
+        # Replaces the ticker's file with `frame`, refetched over the whole
+        # stored range after a re-basing.
+        records = self._records(frame)
+        if not len(records):
+            return 0
+        path = self._path(ticker)
+        with open(path + ".tmp", "wb") as fh:
+            records.tofile(fh)
+        os.replace(path + ".tmp", path)
+        self._checked[ticker] = end
+        return len(records)
+
+    def _append(self, ticker, frame, fetch_from, end):
+        last = self.last_date(ticker)
+        records = self._records(frame, after=None if last is None else _day(last))
+        if len(records):
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._path(ticker), "ab") as fh:
+                records.tofile(fh)
+        # An empty frame is only an answer when the range has no trading
+        # days: a stored ticker always gets its last bar back, and
+        # yf.download returns empty frames for network errors too. Those
+        # are asked again on the next call.
+        if len(frame) or not len(pd.bdate_range(fetch_from, end - datetime.timedelta(days=1))):
+            self._checked[ticker] = end
+        return len(records)
+
+    def update(self, ticker, start, end):
+        # Make sure the store holds bars up to `end` (exclusive), fetching
+        # from `start` for a new ticker or from the last stored bar
+        # otherwise; the whole file is fetched again when that bar has been
+        # re-based. Returns the number of bars written.
+        end = pd.Timestamp(end).date()
+        with self._ticker_lock(ticker):
+            fetch_from = self._missing_from(ticker, start, end)
+            if fetch_from is None:
+                return 0
+            provider = self.provider or get_provider()
+            frame = provider.history(ticker, start=fetch_from, end=end)
+            if self._rebased(ticker, frame):
+                frame = provider.history(ticker, start=self._rebuild_from(ticker, start), end=end)
+                return self._rewrite(ticker, frame, end)
+            return self._append(ticker, frame, fetch_from, end)
+
+    def update_many(self, tickers, start, end):
+        # Same as update() for a ticker list, with one bulk provider request
+        # per distinct missing start date instead of one per ticker.
+        end = pd.Timestamp(end).date()
+        groups = {}
+        for ticker in dict.fromkeys(tickers):
+            with self._ticker_lock(ticker):
+                fetch_from = self._missing_from(ticker, start, end)
+            if fetch_from is not None:
+                groups.setdefault(fetch_from, []).append(ticker)
+
+        provider = self.provider or get_provider()
+        written = {}
+        rebuilds = {}
+        for fetch_from, group in groups.items():
+            frames = provider.history_many(group, start=fetch_from, end=end)
+            for ticker in group:
+                with self._ticker_lock(ticker):
+                    frame = frames.get(ticker)
+                    if frame is None:
+                        written[ticker] = 0
+                    elif self._rebased(ticker, frame):
+                        rebuilds.setdefault(self._rebuild_from(ticker, start), []).append(ticker)
+                    else:
+                        written[ticker] = self._append(ticker, frame, fetch_from, end)
+
+        for rebuild_from, group in rebuilds.items():
+            frames = provider.history_many(group, start=rebuild_from, end=end)
+            for ticker in group:
+                with self._ticker_lock(ticker):
+                    frame = frames.get(ticker)
+                    written[ticker] = 0 if frame is None else self._rewrite(ticker, frame, end)
+        return written
+
+    @staticmethod
+    def _records(frame, after=None):
+        frame = frame[list(COLUMNS.values())].dropna(subset=["Open", "High", "Low", "Close"])
+        records = np.empty(len(frame), dtype=BAR_DTYPE)
+        records["date"] = frame.index.values.astype("datetime64[D]").astype(np.int64)
+        for field, column in COLUMNS.items():
+            records[field] = frame[column].to_numpy(dtype=float)
+        records = records[np.argsort(records["date"], kind="stable")]
+        if after is not None:
+            records = records[records["date"] > after]
+        return records
+
+    def load(self, ticker, start=None, end=None):
+        # Bars in [start, end) as a Date-indexed OHLCV DataFrame.
+        bars = self._bars(ticker)
+        dates = bars["date"]
+        lo = 0 if start is None else int(np.searchsorted(dates, _day(start), side="left"))
+        hi = len(bars) if end is None else int(np.searchsorted(dates, _day(end), side="left"))
+        chunk = np.array(bars[lo:hi])
+
+        index = pd.DatetimeIndex(chunk["date"].astype("datetime64[D]"), name="Date")
+        return pd.DataFrame({column: chunk[field] for field, column in COLUMNS.items()}, index=index)
+
+    def fetch(self, ticker, start, end):
+        self.update(ticker, start, end)
+        return self.load(ticker, start, end)
+
+    def fetch_many(self, tickers, start, end):
+        self.update_many(tickers, start, end)
+        return {ticker: self.load(ticker, start, end) for ticker in dict.fromkeys(tickers)}
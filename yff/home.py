@@ -0,0 +1,11 @@
+import streamlit as st
+
+
+def render(refresh_rate):
+    st.title("Explore Malaysia’s Stock Options in One Place")
+    st.markdown(
+        """
+        Welcome to your one-stop platform for navigating the Malaysian stock market.  
+        Stay **informed**, **compare opportunities**, and make **smarter investment decisions** backed by real-time data and predictive insights.
+        """
+    )
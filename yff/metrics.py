@@ -0,0 +1,188 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, float("inf"))
+RECENT = 1024
+SPAN_METRIC = "yff_span_seconds"
+
+
+def _labels(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels, **extra):
+    pairs = list(labels) + sorted(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in pairs) + "}"
+
+
+class Histogram:
+    # Cumulative bucket counts for the Prometheus output, plus the last
+    # RECENT observations for exact p50/p95 on the diagnostics page.
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=RECENT)
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        self.recent.append(value)
+
+    def quantile(self, q):
+        values = sorted(self.recent)
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class Metrics:
+    # Process-wide spans, counters and gauges. span() times a block into a
+    # histogram; count() bumps a counter; collect() registers a callable
+    # whose {name: number} result is read as gauges at scrape time (cache
+    # hit rates, governor state). Recording is a dict lookup and a few
+    # additions under one lock.
+
+    def __init__(self):
+        self._histograms = {}
+        self._counters = {}
+        self._collectors = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def span(self, name, **labels):
+        # Times the block into the yff_span_seconds histogram, span=name.
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(SPAN_METRIC, time.perf_counter() - start, span=name, **labels)
+
+    def count(self, name, value=1, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def collect(self, source, fn):
+        with self._lock:
+            self._collectors[source] = fn
+
+    def gauges(self):
+        with self._lock:
+            collectors = list(self._collectors.items())
+        values = {}
+        for source, fn in collectors:
+            try:
+                stats = fn() or {}
+            except Exception:
+                continue
+            for key, value in stats.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    values[(source, key)] = float(value)
+        return values
+
+    def spans(self):
+        # [(span, labels, count, p50, p95, max, total)] in seconds.
+        with self._lock:
+            rows = []
+            for (name, labels), h in sorted(self._histograms.items()):
+                labels = dict(labels)
+                rows.append((labels.pop("span", name), labels, h.count, h.quantile(0.5), h.quantile(0.95),
+                             h.max, h.sum))
+            return rows
+
+    def counters(self):
+        with self._lock:
+            return [(name, dict(labels), value) for (name, labels), value in sorted(self._counters.items())]
+
+    def prometheus(self):
+        lines = []
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+            for name in dict.fromkeys(name for (name, _), _ in histograms):
+                lines.append(f"# TYPE {name} histogram")
+                for (metric, labels), h in histograms:
+                    if metric != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(h.buckets, h.counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f"{name}_bucket{_format_labels(labels, le=le)} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {h.sum}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {h.count}")
+            for name in dict.fromkeys(name for (name, _), _ in counters):
+                lines.append(f"# TYPE {name} counter")
+                lines.extend(
+                    f"{name}{_format_labels(labels)} {value}" for (metric, labels), value in counters if metric == name
+                )
+        gauges = self.gauges()
+        for source, key in sorted(gauges):
+            name = f"yff_{source}_{key}"
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {gauges[(source, key)]}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+metrics = Metrics()
+span = metrics.span
+count = metrics.count
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = metrics.prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def serve(port, host="127.0.0.1"):
+    # Prometheus scrape endpoint on http://host:port/metrics in a daemon
+    # thread; started once per process, however many sessions' reruns call
+    # it at once.
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _Handler)
+            threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
+        return _server
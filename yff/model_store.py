@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import joblib
+
+
+# Models are large (a 200-tree forest is 25-30 MB), so they live in the user
+# cache directory rather than the source tree; YFF_MODEL_DIR moves them and
+# YFF_MODEL_CACHE_MB caps how much disk they may take.
+MODEL_DIR = os.environ.get("YFF_MODEL_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "yff", "models"
+)
+MODEL_DISK_BUDGET = int(float(os.environ.get("YFF_MODEL_CACHE_MB", 1024)) * 2 ** 20)
+
+
+class ModelStore:
+    # Trained forecast models keyed by ticker, training window and
+    # hyperparameters. Recently used models stay in memory (LRU), every model
+    # is also written to disk with joblib, and an entry is only reused while
+    # it was trained up to the same last bar as the current history. The
+    # disk copies are kept under `max_disk_bytes`, dropping the least
+    # recently used files (by mtime, which a disk hit refreshes) first.
+
+    def __init__(self, directory=MODEL_DIR, max_models=8, max_disk_bytes=MODEL_DISK_BUDGET):
+        self.directory = directory
+        self.max_models = max_models
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._prune_lock = threading.Lock()
+        self._key_locks = {}
+
+    @staticmethod
+    def key(ticker, window, params):
+        spec = json.dumps({"ticker": ticker, "window": window, "params": params}, sort_keys=True, default=str)
+        return hashlib.sha1(spec.encode()).hexdigest()[:16]
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.joblib")
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_models:
+                self._memory.popitem(last=False)
+
+    def _from_memory(self, key, last_bar):
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry["last_bar"] == last_bar:
+                self._memory.move_to_end(key)
+                return entry
+        return None
+
+    def _from_disk(self, key, last_bar):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            entry = joblib.load(path)
+        except Exception as exc:
+            print(f"Warning: could not load cached model {path}: {exc!r}")
+            return None
+        if entry.get("last_bar") != last_bar:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def _prune(self, keep):
+        # Deletes the least recently used model files until the rest fit in
+        # max_disk_bytes; `keep` (the file just written) always stays. Runs
+        # under its own lock, so lookups are not held up by the disk scan.
+        with self._prune_lock:
+            self._prune_files(keep)
+
+    def _prune_files(self, keep):
+        try:
+            names = [name for name in os.listdir(self.directory) if name.endswith(".joblib")]
+        except OSError:
+            return
+        files = []
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def get_or_train(self, ticker, window, params, last_bar, train):
+        # Returns (model, report) where report records where the model came
+        # from ("memory", "disk" or "trained") and how long that took.
+        key = self.key(ticker, window, params)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            start = time.perf_counter()
+            entry = self._from_memory(key, last_bar)
+            if entry is not None:
+                return entry["model"], {"source": "memory", "seconds": time.perf_counter() - start}
+
+            entry = self._from_disk(key, last_bar)
+            if entry is not None:
+                self._remember(key, entry)
+                return entry["model"], {"source": "disk", "seconds": time.perf_counter() - start}
+
+            model = train()
+            trained = time.perf_counter() - start
+            entry = {"model": model, "last_bar": last_bar, "ticker": ticker, "window": window, "params": params}
+            self._remember(key, entry)
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                joblib.dump(entry, self._path(key))
+            except OSError as exc:
+                print(f"Warning: could not persist model for {ticker}: {exc!r}")
+                persisted = False
+            else:
+                persisted = True
+
+        if persisted:
+            self._prune(self._path(key))
+        return model, {"source": "trained", "seconds": trained}
@@ -0,0 +1,82 @@
+import numpy as np
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.multioutput import MultiOutputRegressor
+
+
+class RidgeModel:
+    # Closed-form ridge regression on standardised features, solved with one
+    # (features x features) linear system in NumPy.
+
+    def __init__(self, alpha=1.0):
+        self.alpha = alpha
+
+    def fit(self, X, y):
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self.x_mean_ = X.mean(axis=0)
+        self.x_scale_ = X.std(axis=0)
+        self.x_scale_[self.x_scale_ == 0] = 1.0
+        self.y_mean_ = y.mean(axis=0)
+
+        Z = (X - self.x_mean_) / self.x_scale_
+        gram = Z.T @ Z + self.alpha * np.eye(Z.shape[1])
+        self.coef_ = np.linalg.solve(gram, Z.T @ (y - self.y_mean_))
+        return self
+
+    def predict(self, X):
+        Z = (np.asarray(X, dtype=float) - self.x_mean_) / self.x_scale_
+        return Z @ self.coef_ + self.y_mean_
+
+
+class NaiveModel:
+    # Baseline: tomorrow's OHLC equals the last observed bar, i.e. the lag-1
+    # OHLC feature columns.
+
+    def __init__(self, lag1_columns=slice(0, 4)):
+        self.lag1_columns = lag1_columns
+
+    def fit(self, X, y):
+        return self
+
+    def predict(self, X):
+        return np.asarray(X, dtype=float)[:, self.lag1_columns]
+
+
+def _forest(params, spec):
+    return RandomForestRegressor(**params)
+
+
+def _ridge(params, spec):
+    return RidgeModel(**params)
+
+
+def _hist_gradient_boosting(params, spec):
+    return MultiOutputRegressor(HistGradientBoostingRegressor(**params))
+
+
+def _naive(params, spec):
+    if 1 not in spec.lags:
+        raise ValueError("the naive model needs lag-1 OHLC features")
+    first = spec.lags.index(1) * 4
+    return NaiveModel(slice(first, first + 4))
+
+
+# name -> (factory(params, spec), default params)
+MODELS = {
+    "Random forest": (_forest, {"n_estimators": 200, "random_state": 42, "n_jobs": -1}),
+    "Ridge": (_ridge, {"alpha": 1.0}),
+    "Histogram gradient boosting": (
+        _hist_gradient_boosting, {"max_iter": 200, "learning_rate": 0.05, "random_state": 42}
+    ),
+    "Naive (last bar)": (_naive, {}),
+}
+DEFAULT_MODEL = "Random forest"
+
+
+def default_params(name):
+    return dict(MODELS[name][1])
+
+
+def build_model(name, params=None, spec=None):
+    factory, defaults = MODELS[name]
+    return factory(defaults if params is None else params, spec)
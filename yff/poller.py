@@ -0,0 +1,137 @@
+import threading
+import time
+
+from .metrics import span
+from .quote_snapshot import QuoteSnapshot
+
+
+class _Universe:
+    def __init__(self, tickers):
+        self.tickers = tickers
+        self.subscribers = {}
+        self.fetched_at = None
+        self.snapshot = QuoteSnapshot(tickers)
+        self.version = 0
+        self.updated_at = None
+        self.error = None
+
+    def interval(self):
+        return min(interval for interval, _ in self.subscribers.values())
+
+    def next_due(self):
+        if self.fetched_at is None:
+            return 0.0
+        return self.fetched_at + self.interval()
+
+
+class QuotePoller:
+    # One background thread refreshes every ticker universe that currently
+    # has subscribers; sessions only read the latest snapshot. `load(tickers)`
+    # returns {ticker: row} and is written into the universe's QuoteSnapshot
+    # in place. Subscriptions
+    # are leases that the session renews on each read, so a tab that is
+    # closed or navigates away simply stops renewing, and the thread exits
+    # once no universe has subscribers left.
+
+    def __init__(self, load, lease_factor=3, min_lease=30):
+        self._load = load
+        self.lease_factor = lease_factor
+        self.min_lease = min_lease
+        self.fetches = 0
+        self._universes = {}
+        self._sessions = {}
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def subscribe(self, session_id, tickers, interval):
+        key = tuple(tickers)
+        now = time.monotonic()
+        expires = now + max(interval * self.lease_factor, self.min_lease)
+        with self._cond:
+            previous = self._sessions.get(session_id)
+            if previous is not None and previous != key and previous in self._universes:
+                self._universes[previous].subscribers.pop(session_id, None)
+            self._sessions[session_id] = key
+
+            universe = self._universes.get(key)
+            if universe is None:
+                universe = self._universes[key] = _Universe(key)
+            universe.subscribers[session_id] = (interval, expires)
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="quote-poller", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        return universe
+
+    def unsubscribe(self, session_id):
+        with self._cond:
+            key = self._sessions.pop(session_id, None)
+            if key in self._universes:
+                self._universes[key].subscribers.pop(session_id, None)
+            self._cond.notify_all()
+
+    def snapshot(self, universe, timeout=None):
+        # Blocks until the universe has been fetched at least once. Returns
+        # (version, QuoteSnapshot or None, updated_at); the snapshot keeps
+        # changing in place, `version` tells whether it did.
+        with self._cond:
+            self._cond.wait_for(lambda: universe.updated_at is not None or universe.error is not None, timeout)
+            loaded = universe.updated_at is not None
+            return universe.version, universe.snapshot if loaded else None, universe.updated_at
+
+    def active(self):
+        with self._cond:
+            return {key: len(u.subscribers) for key, u in self._universes.items()}
+
+    def stats(self):
+        with self._cond:
+            return {
+                "fetches": self.fetches,
+                "universes": len(self._universes),
+                "sessions": len(self._sessions),
+                "tickers": sum(len(key) for key in self._universes),
+            }
+
+    def _expire(self, now):
+        for key, universe in list(self._universes.items()):
+            for session_id, (_, expires) in list(universe.subscribers.items()):
+                if expires <= now:
+                    del universe.subscribers[session_id]
+                    if self._sessions.get(session_id) == key:
+                        del self._sessions[session_id]
+            if not universe.subscribers:
+                del self._universes[key]
+
+    def _run(self):
+        while True:
+            with self._cond:
+                now = time.monotonic()
+                self._expire(now)
+                if not self._universes:
+                    self._thread = None
+                    return
+                due = [u for u in self._universes.values() if u.next_due() <= now]
+                if not due:
+                    wake = min(u.next_due() for u in self._universes.values())
+                    self._cond.wait(timeout=wake - now)
+                    continue
+
+            for universe in due:
+                try:
+                    with span("poller_refresh"):
+                        rows = self._load(universe.tickers)
+                    error = None
+                except Exception as exc:
+                    rows, error = None, exc
+                self.fetches += 1
+                if rows is not None:
+                    universe.snapshot.update(rows)
+
+                with self._cond:
+                    universe.fetched_at = time.monotonic()
+                    universe.error = error
+                    if rows is not None:
+                        universe.updated_at = time.time()
+                        universe.version = universe.snapshot.version
+                    self._cond.notify_all()
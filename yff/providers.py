@@ -0,0 +1,733 @@
+import abc
+import gzip
+import json
+import logging
+import os
+import pickle
+import random
+import struct
+import threading
+from collections import Counter
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+from yfinance.exceptions import YFRateLimitError
+
+from .governor import Governor, RateLimited, UpstreamError
+
+
+HISTORY_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+QUOTE_KEYS = ("currentPrice", "open", "dayHigh", "dayLow", "previousClose", "volume")
+# An all-empty quote batch this large is retried even without a logged 429.
+EMPTY_BATCH_RETRY = 10
+
+
+class DataProvider(abc.ABC):
+    name = "base"
+
+    @abc.abstractmethod
+    def info(self, ticker):
+        pass
+
+    @abc.abstractmethod
+    def history(self, ticker, start, end):
+        # Daily OHLCV bars in [start, end) as a Date-indexed DataFrame.
+        pass
+
+    def history_many(self, tickers, start, end):
+        return {ticker: self.history(ticker, start, end) for ticker in tickers}
+
+    def quotes(self, tickers):
+        # {ticker: {QUOTE_KEYS...}} for many symbols in as few requests as
+        # the source allows; tickers without data are left out. Providers
+        # without a batch endpoint fall back to info() per ticker.
+        found = {}
+        for ticker in tickers:
+            try:
+                info = self.info(ticker)
+            except Exception:
+                continue
+            found[ticker] = {key: info.get(key) for key in QUOTE_KEYS}
+        return found
+
+
+def _history_frame(data):
+    if isinstance(data.columns, pd.MultiIndex):
+        data.columns = data.columns.get_level_values(0)
+    if data.empty:
+        return pd.DataFrame(columns=HISTORY_COLUMNS, index=pd.DatetimeIndex([], name='Date'))
+    data.index = pd.to_datetime(data.index).tz_localize(None)
+    data.index.name = 'Date'
+    return data[HISTORY_COLUMNS]
+
+
+def _split_download(data, tickers):
+    frames = {}
+    for ticker in tickers:
+        if isinstance(data.columns, pd.MultiIndex) and ticker in data.columns.get_level_values(0):
+            frame = data[ticker].dropna(how="all")
+        else:
+            frame = pd.DataFrame()
+        frames[ticker] = _history_frame(frame)
+    return frames
+
+
+def _latest_quote(frame):
+    # Quote fields from the last daily bars: the latest (possibly still
+    # forming) bar gives price, open, range and volume, the one before it
+    # the previous close.
+    frame = frame.dropna(subset=['Close'])
+    if frame.empty:
+        return None
+    last = frame.iloc[-1]
+    volume = last['Volume']
+    return {
+        "currentPrice": float(last['Close']),
+        "open": float(last['Open']),
+        "dayHigh": float(last['High']),
+        "dayLow": float(last['Low']),
+        "previousClose": float(frame['Close'].iloc[-2]) if len(frame) > 1 else None,
+        "volume": None if pd.isna(volume) else int(volume),
+    }
+
+
+class _DownloadErrors(logging.Handler):
+    # yf.download logs per-symbol failures, 429s included, and returns empty
+    # frames instead of raising; this collects what it logged meanwhile.
+    # Other downloads running at the same time may add to it, which at worst
+    # turns their 429 into a retry of this batch too.
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.rate_limited = False
+
+    def emit(self, record):
+        message = record.getMessage()
+        if "YFRateLimitError" in message or "Too Many Requests" in message:
+            self.rate_limited = True
+
+    def __enter__(self):
+        logging.getLogger("yfinance").addHandler(self)
+        return self
+
+    def __exit__(self, *exc):
+        logging.getLogger("yfinance").removeHandler(self)
+
+
+def _all_empty(frames, errors):
+    # A quote batch covers the last five sessions, so one with nothing in it
+    # is an upstream failure worth retrying when a 429 was logged or the
+    # batch is large. A small one is most likely symbols Yahoo does not carry
+    # (e.g. delisted) and is returned as is, so the tickers are reported as
+    # failed instead of retried on every refresh and counted against the
+    # quotes breaker. (History tails can legitimately be empty, e.g. over a
+    # weekend; see _rate_limited.)
+    if not frames or not all(frame.empty for frame in frames.values()):
+        return frames
+    if errors.rate_limited:
+        raise RateLimited(f"rate limited fetching {len(frames)} symbol(s)")
+    if len(frames) >= EMPTY_BATCH_RETRY:
+        raise UpstreamError(f"no data for any of {len(frames)} symbol(s)")
+    return frames
+
+
+def _rate_limited(frames, errors):
+    # History downloads only raise for a logged 429 that left some ticker
+    # without bars, so the governor retries it instead of the empty frame
+    # being taken for a range with no trading days.
+    if errors.rate_limited and any(frame.empty for frame in frames.values()):
+        raise RateLimited(f"rate limited fetching history for {len(frames)} symbol(s)")
+    return frames
+
+
+class YahooProvider(DataProvider):
+    name = "yahoo"
+
+    def info(self, ticker):
+        try:
+            return yf.Ticker(ticker).info
+        except YFRateLimitError as exc:
+            raise RateLimited(str(exc)) from exc
+
+    # History bars are adjusted for splits and dividends, so the forecasters
+    # train on a series without price cliffs. Each adjustment rewrites past
+    # bars, which HistoryStore notices and refetches; only quotes() asks for
+    # the prices as traded.
+    def history(self, ticker, start, end):
+        with _DownloadErrors() as errors:
+            data = yf.download(ticker, start=start, end=end, auto_adjust=True, progress=False)
+        return _rate_limited({ticker: _history_frame(data)}, errors)[ticker]
+
+    def history_many(self, tickers, start, end):
+        tickers = list(tickers)
+        with _DownloadErrors() as errors:
+            data = yf.download(tickers, start=start, end=end, group_by="ticker", auto_adjust=True,
+                               threads=True, progress=False)
+        return _rate_limited(_split_download(data, tickers), errors)
+
+    def quotes(self, tickers):
+        # The last few unadjusted daily bars for the whole list in one
+        # download call, instead of one quoteSummary (.info) payload per
+        # ticker.
+        tickers = list(tickers)
+        with _DownloadErrors() as errors:
+            data = yf.download(tickers, period="5d", interval="1d", group_by="ticker",
+                               auto_adjust=False, threads=True, progress=False)
+        found = {}
+        for ticker, frame in _all_empty(_split_download(data, tickers), errors).items():
+            quote = _latest_quote(frame)
+            if quote is not None:
+                found[ticker] = quote
+        return found
+
+
+class GovernedProvider(DataProvider):
+    # Routes every call of `inner` through a Governor: paced by its token
+    # bucket, retried with backoff, and answered from the last good result
+    # for the same arguments while the endpoint's breaker is open.
+
+    def __init__(self, inner, governor=None):
+        self.inner = inner
+        self.governor = governor or Governor()
+        self.name = inner.name
+
+    def info(self, ticker):
+        return self.governor.call("info", ticker, self.inner.info, ticker)
+
+    def history(self, ticker, start, end):
+        return self.governor.call("history", (ticker, str(start), str(end)), self.inner.history, ticker, start, end)
+
+    def history_many(self, tickers, start, end):
+        tickers = tuple(tickers)
+        return self.governor.call("history", (tickers, str(start), str(end)),
+                                  self.inner.history_many, tickers, start, end)
+
+    def quotes(self, tickers):
+        tickers = tuple(tickers)
+        return self.governor.call("quotes", tickers, self.inner.quotes, tickers)
+
+
+class FlakyProvider(DataProvider):
+    # Local stand-in for a rate-limiting upstream: wraps another provider,
+    # adds `latency` seconds per request and answers with RateLimited (429)
+    # when more than `max_rate` requests arrived in the last second, or at
+    # random with probability `error_rate`. `down` makes every request fail
+    # until it is cleared.
+    name = "flaky"
+
+    def __init__(self, inner, max_rate=None, error_rate=0.0, latency=0.0, seed=0):
+        self.inner = inner
+        self.max_rate = max_rate
+        self.error_rate = error_rate
+        self.latency = latency
+        self.down = False
+        self.calls = 0
+        self.rejected = 0
+        self._recent = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _request(self):
+        with self._lock:
+            now = time.monotonic()
+            self.calls += 1
+            self._recent = [t for t in self._recent if now - t < 1.0]
+            self._recent.append(now)
+            limited = (
+                self.down
+                or (self.max_rate is not None and len(self._recent) > self.max_rate)
+                or self._random.random() < self.error_rate
+            )
+            if limited:
+                self.rejected += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if limited:
+            raise RateLimited("429 Too Many Requests")
+
+    def info(self, ticker):
+        self._request()
+        return self.inner.info(ticker)
+
+    def history(self, ticker, start, end):
+        self._request()
+        return self.inner.history(ticker, start, end)
+
+    def history_many(self, tickers, start, end):
+        self._request()
+        return self.inner.history_many(tickers, start, end)
+
+    def quotes(self, tickers):
+        self._request()
+        return self.inner.quotes(tickers)
+
+
+# Keys of a real Ticker.info (quoteSummary) payload beyond the quote fields.
+# FakeProvider fills them with deterministic values so that payload sizes in
+# benchmarks resemble the real thing.
+INFO_FILLER_KEYS = (
+    "address1", "address2", "city", "zip", "country", "phone", "fax", "website", "industry",
+    "industryKey", "industryDisp", "sector", "sectorKey", "sectorDisp", "fullTimeEmployees",
+    "auditRisk", "boardRisk", "compensationRisk", "shareHolderRightsRisk", "overallRisk",
+    "governanceEpochDate", "compensationAsOfEpochDate", "maxAge", "priceHint",
+    "regularMarketPreviousClose", "regularMarketOpen", "regularMarketDayLow", "regularMarketDayHigh",
+    "dividendRate", "dividendYield", "exDividendDate", "payoutRatio", "fiveYearAvgDividendYield",
+    "beta", "trailingPE", "forwardPE", "regularMarketVolume", "averageVolume", "averageVolume10days",
+    "averageDailyVolume10Day", "bid", "ask", "bidSize", "askSize", "marketCap", "fiftyTwoWeekLow",
+    "fiftyTwoWeekHigh", "priceToSalesTrailing12Months", "fiftyDayAverage", "twoHundredDayAverage",
+    "trailingAnnualDividendRate", "trailingAnnualDividendYield", "currency", "enterpriseValue",
+    "profitMargins", "floatShares", "sharesOutstanding", "heldPercentInsiders",
+    "heldPercentInstitutions", "impliedSharesOutstanding", "bookValue", "priceToBook",
+    "lastFiscalYearEnd", "nextFiscalYearEnd", "mostRecentQuarter", "earningsQuarterlyGrowth",
+    "netIncomeToCommon", "trailingEps", "forwardEps", "lastSplitFactor", "lastSplitDate",
+    "enterpriseToRevenue", "enterpriseToEbitda", "52WeekChange", "SandP52WeekChange",
+    "lastDividendValue", "lastDividendDate", "exchange", "quoteType", "symbol", "underlyingSymbol",
+    "longName", "firstTradeDateEpochUtc", "timeZoneFullName", "timeZoneShortName", "uuid",
+    "messageBoardId", "gmtOffSetMilliseconds", "targetHighPrice", "targetLowPrice",
+    "targetMeanPrice", "targetMedianPrice", "recommendationMean", "recommendationKey",
+    "numberOfAnalystOpinions", "totalCash", "totalCashPerShare", "ebitda", "totalDebt",
+    "quickRatio", "currentRatio", "totalRevenue", "debtToEquity", "revenuePerShare",
+    "returnOnAssets", "returnOnEquity", "grossProfits", "freeCashflow", "operatingCashflow",
+    "earningsGrowth", "revenueGrowth", "grossMargins", "ebitdaMargins", "operatingMargins",
+    "financialCurrency", "trailingPegRatio",
+)
+
+
+class FakeProvider(DataProvider):
+    # Deterministic stand-in for Yahoo, used by benchmarks and offline runs.
+    # `calls` counts requests; `requested` counts (endpoint, ticker) pairs.
+    name = "fake"
+
+    def __init__(self, latency=0.0, fail=(), slow=None):
+        self.latency = latency
+        self.fail = set(fail)
+        self.slow = dict(slow or {})
+        self.calls = 0
+        self.requested = Counter()
+        self._lock = threading.Lock()
+
+    def _count(self, endpoint, tickers):
+        with self._lock:
+            self.calls += 1
+            self.requested.update((endpoint, ticker) for ticker in tickers)
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.requested.clear()
+
+    @staticmethod
+    def _quote(ticker):
+        rng = random.Random(zlib.crc32(ticker.encode()))
+        close = round(rng.uniform(0.05, 25.0), 3)
+        open_ = round(close * rng.uniform(0.97, 1.03), 3)
+        high = round(max(open_, close) * rng.uniform(1.0, 1.04), 3)
+        low = round(min(open_, close) * rng.uniform(0.96, 1.0), 3)
+        return {
+            "currentPrice": round(rng.uniform(low, high), 3),
+            "open": open_,
+            "dayHigh": high,
+            "dayLow": low,
+            "previousClose": close,
+            "volume": rng.randrange(1000, 5000000),
+        }
+
+    def info(self, ticker):
+        self._count("info", [ticker])
+        delay = self.slow.get(ticker, self.latency)
+        if delay:
+            time.sleep(delay)
+        if ticker in self.fail:
+            raise RuntimeError(f"fake provider refused {ticker}")
+
+        rng = random.Random(zlib.crc32(ticker.encode()) ^ 0x5EED)
+        info = {key: round(rng.uniform(0, 1e9), 4) for key in INFO_FILLER_KEYS}
+        info["longBusinessSummary"] = " ".join(
+            rng.choice(("manufacturing", "holdings", "services", "Malaysia", "segment", "investment"))
+            for _ in range(90)
+        )
+        info["companyOfficers"] = [
+            {"maxAge": 1, "name": f"Officer {i}", "title": "Director", "fiscalYear": 2024,
+             "totalPay": rng.randrange(100000, 5000000), "yearBorn": rng.randrange(1950, 1990)}
+            for i in range(rng.randrange(2, 8))
+        ]
+        info.update(self._quote(ticker), shortName=f"FAKE {ticker.split('.')[0]}")
+        return info
+
+    def quotes(self, tickers):
+        tickers = list(tickers)
+        self._count("quotes", tickers)
+        delay = max([self.latency] + [self.slow[t] for t in tickers if t in self.slow])
+        if delay:
+            time.sleep(delay)
+        return {t: self._quote(t) for t in tickers if t not in self.fail}
+
+    def history(self, ticker, start, end):
+        # A seeded random walk over business days from a fixed origin, so the
+        # same date always gets the same bar however the range is split.
+        self._count("history", [ticker])
+        if self.latency:
+            time.sleep(self.latency)
+        if ticker in self.fail:
+            raise RuntimeError(f"fake provider refused {ticker}")
+
+        dates = pd.bdate_range("2015-01-01", "2040-12-31", name='Date')
+        rng = np.random.default_rng(zlib.crc32(ticker.encode()))
+        close = rng.uniform(0.5, 20.0) * np.exp(np.cumsum(rng.normal(0, 0.015, len(dates))))
+        open_ = close * np.exp(rng.normal(0, 0.005, len(dates)))
+        high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, len(dates))))
+        low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, len(dates))))
+        volume = rng.integers(1000, 5000000, len(dates)).astype(float)
+        frame = pd.DataFrame(
+            {'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': volume}, index=dates
+        )
+        return frame.loc[pd.Timestamp(start):pd.Timestamp(end) - pd.Timedelta(days=1)]
+
+
+class FixtureProvider(DataProvider):
+    # Serves recorded bars from <directory>/<ticker>.csv (Date,Open,High,Low,
+    # Close,Volume) and recorded .info payloads from <directory>/quotes.json.
+    # quotes() answers from the last recorded bars, like the batched Yahoo
+    # call. Every request costs `latency` seconds and `bytes` adds up the
+    # JSON size of the .info and quote payloads served.
+    name = "fixture"
+
+    def __init__(self, directory, latency=0.0):
+        self.directory = directory
+        self.latency = latency
+        self.calls = 0
+        self.bytes = 0
+        self._frames = {}
+        self._latest_quotes = {}
+        self._quotes = None
+        self._lock = threading.Lock()
+
+    def _delay(self, size=0):
+        with self._lock:
+            self.calls += 1
+            self.bytes += size
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _path(self, name):
+        # Fixtures may be stored gzipped (<name>.gz).
+        path = os.path.join(self.directory, name)
+        return path if os.path.exists(path) or not os.path.exists(path + ".gz") else path + ".gz"
+
+    def _frame(self, ticker):
+        frame = self._frames.get(ticker)
+        if frame is None:
+            path = self._path(f"{ticker}.csv")
+            if not os.path.exists(path):
+                return _history_frame(pd.DataFrame())
+            frame = pd.read_csv(path, index_col='Date', parse_dates=True)
+            self._frames[ticker] = frame = _history_frame(frame)
+        return frame
+
+    def info(self, ticker):
+        if self._quotes is None:
+            path = self._path("quotes.json")
+            with (gzip.open if path.endswith(".gz") else open)(path, "rt", encoding="utf-8") as fh:
+                self._quotes = json.load(fh)
+        info = self._quotes.get(ticker)
+        self._delay(len(json.dumps(info)) if info is not None else 0)
+        if info is None:
+            raise KeyError(f"no recorded quote for {ticker}")
+        return info
+
+    def _latest(self, ticker):
+        latest = self._latest_quotes.get(ticker)
+        if latest is None:
+            bars = self._frame(ticker).tail(5)
+            latest = self._latest_quotes[ticker] = (_latest_quote(bars), len(bars.to_json()))
+        return latest
+
+    def quotes(self, tickers):
+        found, size = {}, 0
+        for ticker in tickers:
+            quote, payload = self._latest(ticker)
+            size += payload
+            if quote is not None:
+                found[ticker] = quote
+        self._delay(size)
+        return found
+
+    def history(self, ticker, start, end):
+        self._delay()
+        frame = self._frame(ticker)
+        return frame.loc[pd.Timestamp(start):pd.Timestamp(end) - pd.Timedelta(days=1)]
+
+
+def record_fixtures(source, directory, tickers, start, end, compress=False, float_format=None):
+    # Writes what FixtureProvider serves: source.info() per ticker into
+    # quotes.json and source.history_many() bars into <ticker>.csv, gzipped
+    # if `compress`. With YahooProvider this records real responses; with
+    # FakeProvider it makes a synthetic set.
+    os.makedirs(directory, exist_ok=True)
+    suffix = ".gz" if compress else ""
+    tickers = list(dict.fromkeys(tickers))
+    quotes = {}
+    for ticker in tickers:
+        try:
+            quotes[ticker] = source.info(ticker)
+        except Exception as exc:
+            print(f"Warning: no quote recorded for {ticker}: {exc!r}")
+    # mtime=0 keeps gzipped fixtures byte-identical when regenerated.
+    payload = json.dumps(quotes).encode("utf-8")
+    with open(os.path.join(directory, "quotes.json" + suffix), "wb") as fh:
+        fh.write(gzip.compress(payload, mtime=0) if compress else payload)
+
+    compression = {"method": "gzip", "mtime": 0} if compress else None
+    for ticker, frame in source.history_many(tickers, start, end).items():
+        if not frame.empty:
+            frame.to_csv(os.path.join(directory, f"{ticker}.csv{suffix}"), index_label='Date',
+                         float_format=float_format, compression=compression)
+    return directory
+
+
+# Archive records: a 4-byte big-endian length, then a zlib-compressed pickle
+# of (endpoint, key, offset, duration, result, error). Each one is appended
+# on its own, so a recording cut short still replays up to its last whole
+# record. Only replay archives you recorded yourself: they are pickles.
+_RECORD_HEADER = struct.Struct(">I")
+
+
+def _call_key(endpoint, args):
+    if endpoint in ("info", "history"):
+        return tuple(str(arg) for arg in args)
+    if endpoint == "quotes":
+        return tuple(args[0])
+    tickers, start, end = args
+    return (tuple(tickers), str(start), str(end))
+
+
+def read_archive(path):
+    # Yields the records of a RecordingProvider archive in the order they
+    # were written.
+    with open(path, "rb") as fh:
+        while True:
+            header = fh.read(_RECORD_HEADER.size)
+            if len(header) < _RECORD_HEADER.size:
+                return
+            (size,) = _RECORD_HEADER.unpack(header)
+            payload = fh.read(size)
+            if len(payload) < size:
+                return
+            yield pickle.loads(zlib.decompress(payload))
+
+
+class RecordingProvider(DataProvider):
+    # Passes every call through to `inner` and appends what it answered (or
+    # the error it raised) to the archive at `path`, with the call's offset
+    # from the start of the recording and how long it took. Goes under the
+    # Governor, so retries and 429s are recorded as they happened.
+
+    def __init__(self, inner, path):
+        self.inner = inner
+        self.path = path
+        self.name = inner.name
+        self.calls = 0
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def _record(self, endpoint, fn, *args):
+        offset = time.monotonic() - self._started
+        start = time.perf_counter()
+        result, error = None, None
+        try:
+            result = fn(*args)
+            return result
+        except Exception as exc:
+            error = (type(exc).__name__, str(exc))
+            raise
+        finally:
+            record = (endpoint, _call_key(endpoint, args), offset, time.perf_counter() - start, result, error)
+            payload = zlib.compress(pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL))
+            with self._lock:
+                self.calls += 1
+                with open(self.path, "ab") as fh:
+                    fh.write(_RECORD_HEADER.pack(len(payload)) + payload)
+
+    def info(self, ticker):
+        return self._record("info", self.inner.info, ticker)
+
+    def history(self, ticker, start, end):
+        return self._record("history", self.inner.history, ticker, start, end)
+
+    def history_many(self, tickers, start, end):
+        return self._record("history_many", self.inner.history_many, list(tickers), start, end)
+
+    def quotes(self, tickers):
+        return self._record("quotes", self.inner.quotes, list(tickers))
+
+
+class ReplayProvider(DataProvider):
+    # Serves a RecordingProvider archive without touching the network. A
+    # call with the same arguments as a recorded one gets the recorded
+    # answers in order (the last one repeats once they run out), recorded
+    # errors included, each after its recorded duration times `scale` (1.0
+    # original timing, 0 instant). With `paced`, such a call also waits for
+    # its recorded offset times `scale`, counted from the first call of the
+    # replay, so calls arriving faster than recorded are held to the
+    # recording's schedule. Other calls are answered from the latest
+    # recorded quote or info per ticker and from recorded bars cut to the
+    # requested range; `misses` counts the calls nothing recorded could answer
+    # (LookupError).
+    name = "replay"
+
+    def __init__(self, path, scale=1.0, paced=False):
+        self.path = path
+        self.scale = scale
+        self.paced = paced
+        self.calls = 0
+        self.misses = 0
+        self._records = {}
+        self._cursors = Counter()
+        self._info = {}
+        self._quotes = {}
+        self._bars = {}
+        self._first_offset = None
+        self._origin = None
+        self._lock = threading.Lock()
+        for endpoint, key, offset, duration, result, error in read_archive(path):
+            self._records.setdefault((endpoint, key), []).append((offset, duration, result, error))
+            if self._first_offset is None:
+                self._first_offset = offset
+            if error is not None:
+                continue
+            if endpoint == "info":
+                self._info[key[0]] = result
+            elif endpoint == "quotes":
+                self._quotes.update(result)
+            elif endpoint == "history":
+                self._keep_bars(key[0], result)
+            elif endpoint == "history_many":
+                for ticker, frame in result.items():
+                    self._keep_bars(ticker, frame)
+
+    def _keep_bars(self, ticker, frame):
+        kept = self._bars.get(ticker)
+        if kept is not None and not frame.empty:
+            frame = pd.concat([kept, frame])
+            frame = frame[~frame.index.duplicated(keep="last")].sort_index()
+        elif kept is not None:
+            return
+        self._bars[ticker] = frame
+
+    def _replay(self, endpoint, args):
+        # The recorded (offset, duration, result, error) for this call, or
+        # None.
+        key = (endpoint, _call_key(endpoint, args))
+        with self._lock:
+            self.calls += 1
+            if self._origin is None:
+                self._origin = time.monotonic() - (self._first_offset or 0.0) * self.scale
+            recorded = self._records.get(key)
+            if recorded is None:
+                return None
+            index = min(self._cursors[key], len(recorded) - 1)
+            self._cursors[key] += 1
+        return recorded[index]
+
+    def _serve(self, endpoint, args, fallback):
+        recorded = self._replay(endpoint, args)
+        if recorded is None:
+            return fallback()
+        offset, duration, result, error = recorded
+        if self.scale:
+            delay = duration * self.scale
+            if self.paced:
+                delay += max(0.0, self._origin + offset * self.scale - time.monotonic())
+            time.sleep(delay)
+        if error is None:
+            return result
+        name, message = error
+        raise (RateLimited if name == RateLimited.__name__ else UpstreamError)(message)
+
+    def _miss(self, what):
+        # Not an UpstreamError: the Governor would retry it with backoff and
+        # count it against the breaker, none of which happened when recording.
+        with self._lock:
+            self.misses += 1
+        raise LookupError(f"{what} is not in the recording {self.path}")
+
+    def _slice(self, ticker, start, end):
+        frame = self._bars.get(ticker)
+        if frame is None:
+            return None
+        return frame.loc[pd.Timestamp(start):pd.Timestamp(end) - pd.Timedelta(days=1)]
+
+    def info(self, ticker):
+        def fallback():
+            if ticker not in self._info:
+                self._miss(f"info for {ticker}")
+            return self._info[ticker]
+        return self._serve("info", (ticker,), fallback)
+
+    def history(self, ticker, start, end):
+        def fallback():
+            frame = self._slice(ticker, start, end)
+            if frame is None:
+                self._miss(f"history for {ticker}")
+            return frame
+        return self._serve("history", (ticker, start, end), fallback)
+
+    def history_many(self, tickers, start, end):
+        tickers = list(tickers)
+
+        def fallback():
+            frames = {ticker: self._slice(ticker, start, end) for ticker in tickers}
+            if all(frame is None for frame in frames.values()):
+                self._miss(f"history for {len(tickers)} symbol(s)")
+            return {ticker: frame for ticker, frame in frames.items() if frame is not None}
+        return self._serve("history_many", (tickers, start, end), fallback)
+
+    def quotes(self, tickers):
+        tickers = list(tickers)
+
+        def fallback():
+            found = {ticker: self._quotes[ticker] for ticker in tickers if ticker in self._quotes}
+            if not found:
+                self._miss(f"quotes for {len(tickers)} symbol(s)")
+            return found
+        return self._serve("quotes", (tickers,), fallback)
+
+
+_provider = None
+
+
+def provider_from_env():
+    # YFF_PROVIDER picks the data source: "yahoo" (the default), "fake",
+    # "fixtures:<dir>", "record:<archive>" (Yahoo, recording every response)
+    # or "replay:<archive>", played back at YFF_REPLAY_SCALE times the
+    # recorded timing (default 1.0, 0 for no delay) and, with
+    # YFF_REPLAY_PACED=1, on the recorded schedule.
+    kind, _, path = os.environ.get("YFF_PROVIDER", "yahoo").partition(":")
+    if kind == "yahoo":
+        return GovernedProvider(YahooProvider())
+    if kind == "fake":
+        return FakeProvider()
+    if kind == "fixtures" and path:
+        return FixtureProvider(path)
+    if kind == "record" and path:
+        return GovernedProvider(RecordingProvider(YahooProvider(), path))
+    if kind == "replay" and path:
+        return GovernedProvider(ReplayProvider(path, float(os.environ.get("YFF_REPLAY_SCALE", 1.0)),
+                                               os.environ.get("YFF_REPLAY_PACED") == "1"))
+    raise ValueError(f"unknown YFF_PROVIDER {os.environ['YFF_PROVIDER']!r}")
+
+
+def get_provider():
+    global _provider
+    if _provider is None:
+        _provider = provider_from_env()
+    return _provider
+
+
+def set_provider(provider):
+    global _provider
+    _provider = provider
@@ -0,0 +1,126 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class QuoteCache:
+    # Process-wide quote cache shared by every Streamlit session. Entries
+    # expire after `ttl` seconds (or their own, see put_many), the least recently used tickers are evicted
+    # beyond `max_size`, and concurrent misses on the same ticker are
+    # collapsed into a single upstream fetch.
+
+    def __init__(self, ttl=15, max_size=2000, wait_timeout=30):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.wait_timeout = wait_timeout
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def _fresh(self, ticker, now):
+        entry = self._entries.get(ticker)
+        if entry is None or now >= entry[0]:
+            return None
+        self._entries.move_to_end(ticker)
+        return entry[1]
+
+    def _evict(self):
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def peek_many(self, tickers, count=True):
+        # The fresh entries among `tickers`, without loading or waiting for
+        # the rest. `count=False` leaves the lookups out of the stats, for a
+        # second look at tickers already counted.
+        now = time.monotonic()
+        with self._lock:
+            found = {}
+            unique = dict.fromkeys(tickers)
+            for ticker in unique:
+                row = self._fresh(ticker, now)
+                if row is not None:
+                    found[ticker] = row
+            if count:
+                self.hits += len(found)
+                self.misses += len(unique) - len(found)
+            return found
+
+    def put_many(self, rows, ttl=None):
+        # Stores {ticker: row} for `ttl` seconds (default: the cache's) where
+        # no fresh entry exists yet.
+        now = time.monotonic()
+        expires = now + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            for ticker, row in rows.items():
+                if self._fresh(ticker, now) is None:
+                    self._entries[ticker] = (expires, row)
+                    self._entries.move_to_end(ticker)
+            self._evict()
+
+    def get_many(self, tickers, loader, count=True):
+        # `loader(missing)` must return {ticker: row} for the tickers it could
+        # fetch; tickers it leaves out are not cached and are simply absent
+        # from the result. `count` is as for peek_many().
+        found = {}
+        waiting = {}
+        claimed = []
+        now = time.monotonic()
+        with self._lock:
+            for ticker in dict.fromkeys(tickers):
+                row = self._fresh(ticker, now)
+                if row is not None:
+                    found[ticker] = row
+                    self.hits += count
+                elif ticker in self._inflight:
+                    waiting[ticker] = self._inflight[ticker]
+                    self.coalesced += count
+                else:
+                    self._inflight[ticker] = threading.Event()
+                    claimed.append(ticker)
+                    self.misses += count
+
+        if claimed:
+            loaded = {}
+            try:
+                loaded = loader(claimed) or {}
+            finally:
+                with self._lock:
+                    expires = time.monotonic() + self.ttl
+                    for ticker in claimed:
+                        if ticker in loaded:
+                            self._entries[ticker] = (expires, loaded[ticker])
+                            self._entries.move_to_end(ticker)
+                        self._inflight.pop(ticker).set()
+                    self._evict()
+            found.update((t, loaded[t]) for t in claimed if t in loaded)
+
+        for ticker, event in waiting.items():
+            event.wait(self.wait_timeout)
+            with self._lock:
+                entry = self._entries.get(ticker)
+            if entry is not None:
+                found[ticker] = entry[1]
+
+        return found
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.coalesced = self.evictions = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            }
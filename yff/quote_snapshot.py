@@ -0,0 +1,148 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+NUMERIC_COLUMNS = ("Current Price", "Open", "High", "Low", "Close", "Volume")
+SORTED_COLUMNS = ("Current Price", "Open", "Volume")
+
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class QuoteSnapshot:
+    # Latest quote of a fixed ticker list as one float64 array per column,
+    # addressed by the ticker's position. update() writes changed rows in
+    # place and bumps `version` only when a value actually changed.
+    #
+    # For each column in SORTED_COLUMNS the positions with a value are kept
+    # ordered by (value ascending, position descending), together with the
+    # sorted values, so range queries are binary searches and the reversed
+    # order is the usual "highest first, ties in ticker order" listing. A
+    # small update moves only the changed rows; a large one re-sorts.
+    # DataFrames are only built by frame(), for display.
+
+    def __init__(self, tickers, sorted_columns=SORTED_COLUMNS):
+        self.tickers = tuple(tickers)
+        self.position = {ticker: i for i, ticker in enumerate(self.tickers)}
+        size = len(self.tickers)
+        self.names = np.full(size, "", dtype=object)
+        self.values = {column: np.full(size, np.nan) for column in NUMERIC_COLUMNS}
+        self.version = 0
+        self._order = {column: np.empty(0, dtype=np.intp) for column in sorted_columns}
+        self._keys = {column: np.empty(0) for column in sorted_columns}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def update(self, rows):
+        # rows: {ticker: {"Name": ..., column: value}}, e.g. quote_row()
+        # output. Tickers not in the snapshot or not in `rows` keep their
+        # previous values. Returns True if anything changed.
+        with self._lock:
+            changed = {}
+            for ticker, row in rows.items():
+                i = self.position.get(ticker)
+                if i is None:
+                    continue
+                name = row.get("Name") or ""
+                if name != self.names[i]:
+                    self.names[i] = name
+                    changed.setdefault(i, set())
+                for column, values in self.values.items():
+                    value = _number(row.get(column))
+                    old = values[i]
+                    if value != old and not (value != value and old != old):
+                        values[i] = value
+                        changed.setdefault(i, set()).add(column)
+
+            if not changed:
+                return False
+            for column in self._order:
+                moved = np.fromiter((i for i, columns in changed.items() if column in columns), dtype=np.intp)
+                if len(moved):
+                    self._reorder(column, moved)
+            self.version += 1
+            return True
+
+    def _reorder(self, column, moved):
+        values = self.values[column]
+        if len(moved) * 8 > len(self.tickers):
+            present = np.flatnonzero(~np.isnan(values))
+            order = present[np.lexsort((-present, values[present]))]
+            self._order[column], self._keys[column] = order, values[order]
+            return
+
+        order, keys = self._order[column], self._keys[column]
+        keep = ~np.isin(order, moved)
+        order, keys = order[keep], keys[keep]
+        for i in moved:
+            value = values[i]
+            if np.isnan(value):
+                continue
+            lo = int(np.searchsorted(keys, value, side="left"))
+            hi = int(np.searchsorted(keys, value, side="right"))
+            at = lo + int(np.searchsorted(-order[lo:hi], -i))
+            order = np.insert(order, at, i)
+            keys = np.insert(keys, at, value)
+        self._order[column], self._keys[column] = order, keys
+
+    def rows(self, column, descending=False):
+        # Every position ordered by `column`; rows without a value come last
+        # in ticker order.
+        with self._lock:
+            order = self._order[column]
+            missing = np.flatnonzero(np.isnan(self.values[column]))
+        return np.concatenate([order[::-1] if descending else order, missing])
+
+    def range(self, column, low=None, high=None):
+        # Positions with low <= column <= high, lowest value first.
+        with self._lock:
+            keys, order = self._keys[column], self._order[column]
+            start = 0 if low is None else int(np.searchsorted(keys, low, side="left"))
+            stop = len(keys) if high is None else int(np.searchsorted(keys, high, side="right"))
+            return order[start:stop]
+
+    def query(self, ranges, mask=None, sort_by=None, descending=False):
+        # ranges: {column: (low, high)} with None for an open end; `mask` is
+        # an optional boolean array over positions. The narrowest range picks
+        # the candidates and the others are checked on those rows only.
+        # Returns positions, ordered by `sort_by` if given.
+        ranges = {column: bounds for column, bounds in ranges.items() if bounds != (None, None)}
+        with self._lock:
+            if ranges:
+                rows = min((self.range(column, *bounds) for column, bounds in ranges.items()), key=len)
+                keep = np.ones(len(rows), dtype=bool)
+                for column, (low, high) in ranges.items():
+                    values = self.values[column][rows]
+                    if low is not None:
+                        keep &= values >= low
+                    if high is not None:
+                        keep &= values <= high
+                rows = rows[keep]
+            else:
+                rows = np.arange(len(self.tickers))
+            if mask is not None:
+                rows = rows[mask[rows]]
+
+            if sort_by is None:
+                return np.sort(rows)
+            rank = np.empty(len(self.tickers), dtype=np.intp)
+            rank[self.rows(sort_by, descending)] = np.arange(len(self.tickers))
+            return rows[np.argsort(rank[rows])]
+
+    def frame(self, rows=None):
+        # The snapshot (or the given positions, in that order) as the usual
+        # quote table.
+        with self._lock:
+            rows = np.arange(len(self.tickers)) if rows is None else np.asarray(rows, dtype=np.intp)
+            data = {"Ticker": np.asarray(self.tickers, dtype=object)[rows], "Name": self.names[rows]}
+            data.update((column, values[rows]) for column, values in self.values.items())
+        data["Volume"] = pd.Series(np.round(data["Volume"])).astype("Int64").array
+        return pd.DataFrame(data, index=rows)
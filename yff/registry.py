@@ -0,0 +1,96 @@
+import json
+import os
+import re
+import threading
+
+
+REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sectors.json")
+
+SYMBOL_PATTERN = re.compile(r"^\d{4,5}[A-Z0-9]*\.KL$")
+
+
+class RegistryError(ValueError):
+    pass
+
+
+class SectorRegistry:
+    # market -> sector -> tickers, loaded from sectors.json. Lookups are plain
+    # dict accesses and a reverse index maps every ticker back to the
+    # (market, sector) pairs that list it.
+
+    def __init__(self, markets):
+        problems = validate(markets)
+        if problems:
+            raise RegistryError("invalid sector registry:\n  " + "\n  ".join(problems))
+
+        self._markets = {
+            market: {sector: tuple(tickers) for sector, tickers in sectors.items()}
+            for market, sectors in markets.items()
+        }
+        self._by_ticker = {}
+        for market, sectors in self._markets.items():
+            for sector, tickers in sectors.items():
+                for ticker in tickers:
+                    self._by_ticker.setdefault(ticker, []).append((market, sector))
+
+    @classmethod
+    def from_file(cls, path=REGISTRY_PATH):
+        with open(path, encoding="utf-8") as fh:
+            return cls(json.load(fh))
+
+    def markets(self):
+        return tuple(self._markets)
+
+    def sectors(self, market):
+        return tuple(self._markets[market])
+
+    def tickers(self, market, sector):
+        return self._markets[market][sector]
+
+    def sectors_of(self, ticker):
+        return tuple(self._by_ticker.get(ticker, ()))
+
+    def all_tickers(self, markets=None):
+        seen = {}
+        for market in markets or self._markets:
+            for tickers in self._markets[market].values():
+                seen.update(dict.fromkeys(tickers))
+        return tuple(seen)
+
+    def __contains__(self, ticker):
+        return ticker in self._by_ticker
+
+
+def validate(markets):
+    problems = []
+    if not isinstance(markets, dict) or not markets:
+        return ["registry must map market names to sectors"]
+    for market, sectors in markets.items():
+        if not isinstance(sectors, dict) or not sectors:
+            problems.append(f"{market}: no sectors")
+            continue
+        for sector, tickers in sectors.items():
+            if not isinstance(tickers, list) or not tickers:
+                problems.append(f"{market} / {sector}: no tickers")
+                continue
+            seen = set()
+            for ticker in tickers:
+                if not isinstance(ticker, str) or not SYMBOL_PATTERN.match(ticker):
+                    problems.append(f"{market} / {sector}: malformed ticker {ticker!r}")
+                elif ticker in seen:
+                    problems.append(f"{market} / {sector}: duplicate ticker {ticker}")
+                seen.add(ticker)
+    return problems
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = SectorRegistry.from_file()
+    return _registry
@@ -0,0 +1,97 @@
+import datetime
+import threading
+import time
+import uuid
+
+import numpy as np
+import streamlit as st
+
+from .data import quote_poller
+from .metrics import SPAN_METRIC, metrics, span
+from .registry import get_registry
+from .widgets import snapshot_table
+
+
+# The whole market is refreshed at most this often, whatever the sidebar
+# refresh rate; the page itself re-reads the latest snapshot every
+# SCREENER_POLL seconds, a sub-millisecond query on the shared snapshot.
+SCREENER_MIN_INTERVAL = 120
+SCREENER_POLL = 10
+
+_mask_lock = threading.Lock()
+_market_masks = {}
+
+
+def market_masks(tickers):
+    # market -> boolean mask over the positions of `tickers`, shared by
+    # every session watching the same universe.
+    with _mask_lock:
+        masks = _market_masks.get(tickers)
+    if masks is None:
+        registry = get_registry()
+        masks = {market: np.zeros(len(tickers), dtype=bool) for market in registry.markets()}
+        for i, ticker in enumerate(tickers):
+            for market, _ in registry.sectors_of(ticker):
+                masks[market][i] = True
+        with _mask_lock:
+            _market_masks[tickers] = masks
+    return masks
+
+
+def render(refresh_rate):
+    st.title("Screener")
+    registry = get_registry()
+    tickers = registry.all_tickers()
+    interval = max(refresh_rate, SCREENER_MIN_INTERVAL)
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    session_id = st.session_state.session_id
+
+    @st.fragment(run_every=SCREENER_POLL)
+    def results():
+        col_market, col_open, col_volume, col_sort = st.columns([0.4, 0.2, 0.2, 0.2])
+        with col_market:
+            markets = st.multiselect("Markets", registry.markets(), default=registry.markets())
+        with col_open:
+            max_open = st.number_input(
+                "Max Open price", min_value=0.0, value=float(st.session_state.get("max_range", 1.0)), step=0.1
+            )
+        with col_volume:
+            min_volume = st.number_input("Min volume", min_value=0, value=0, step=10000)
+        with col_sort:
+            sort_by = st.selectbox("Sort by", ("Volume", "Open", "Current Price"))
+
+        universe = quote_poller.subscribe(session_id, tickers, interval)
+        version, snapshot, updated_at = quote_poller.snapshot(universe, timeout=1)
+        if snapshot is None:
+            st.info(f"Loading quotes for {len(tickers)} tickers, this page updates when they arrive.")
+            return
+
+        def build(markets, max_open, min_volume, sort_by):
+            masks = market_masks(universe.tickers)
+            allowed = np.zeros(len(snapshot), dtype=bool)
+            for market in markets:
+                allowed |= masks[market]
+            start = time.perf_counter()
+            rows = snapshot.query(
+                {"Open": (None, max_open), "Volume": (min_volume or None, None)},
+                mask=allowed,
+                sort_by=sort_by,
+                descending=True,
+            )
+            elapsed = time.perf_counter() - start
+            metrics.observe(SPAN_METRIC, elapsed, span="screener_query")
+            return snapshot.frame(rows), elapsed
+
+        matches, elapsed = snapshot_table(
+            "screener_table", snapshot, version, build, tuple(markets), max_open, min_volume, sort_by
+        )
+
+        with span("render_table", page="screener"):
+            st.dataframe(matches, use_container_width=True, hide_index=True)
+        st.caption(
+            f"{len(matches)} of {len(snapshot)} tickers match ({elapsed * 1000:.1f} ms). "
+            "Quotes as of " + datetime.datetime.fromtimestamp(updated_at).strftime("%H:%M:%S")
+        )
+
+    results()
@@ -0,0 +1,40 @@
+import datetime
+import uuid
+
+import streamlit as st
+
+from .data import REQUEST_TIMEOUT, quote_poller
+from .metrics import span
+from .registry import get_registry
+from .widgets import sector_picker, snapshot_table
+
+
+def show_sector(market, refresh_rate, sector):
+    tickers = get_registry().tickers(market, sector)
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    session_id = st.session_state.session_id
+
+    @st.fragment(run_every=refresh_rate)
+    def live_table():
+        universe = quote_poller.subscribe(session_id, tickers, refresh_rate)
+        version, snapshot, updated_at = quote_poller.snapshot(universe, timeout=REQUEST_TIMEOUT * 2)
+        if snapshot is None:
+            st.warning("Quotes are still loading, retrying shortly.")
+            return
+        table = snapshot_table(
+            "view_table", snapshot, version,
+            lambda: snapshot.frame(snapshot.rows("Current Price", descending=True)),
+        )
+        with span("render_table", page="view"):
+            st.dataframe(table, use_container_width=True)
+        st.caption("Last updated " + datetime.datetime.fromtimestamp(updated_at).strftime("%H:%M:%S"))
+
+    live_table()
+
+
+def render(refresh_rate):
+    col_market, col_sector = st.columns(2)
+    market_options, options = sector_picker(col_market, col_sector, "display")
+
+    show_sector(market_options, refresh_rate, options)
@@ -0,0 +1,31 @@
+import streamlit as st
+
+from .metrics import count
+from .registry import get_registry
+
+
+def sector_picker(market_column, sector_column, key):
+    registry = get_registry()
+    with market_column:
+        market = st.selectbox('Market', registry.markets(), key=f"market_{key}")
+    with sector_column:
+        sector = st.selectbox(
+            'Select the sector you are interested',
+            registry.sectors(market),
+            key=f"sector_{key}_{market}"
+        )
+    return market, sector
+
+
+def snapshot_table(key, snapshot, version, build, *args):
+    # build(*args) for this session, kept in session_state under `key` and
+    # reused while the snapshot version and the arguments are unchanged. A
+    # fragment has to emit its table on every run, but only rebuilds it
+    # when the quotes (or the filters) moved.
+    cached = st.session_state.get(key)
+    if cached is not None and cached[0] is snapshot and cached[1] == version and cached[2] == args:
+        count("yff_table_reused_total", table=key)
+        return cached[3]
+    result = build(*args)
+    st.session_state[key] = (snapshot, version, args, result)
+    return result